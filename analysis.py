@@ -0,0 +1,69 @@
+from matcher import PhraseMatcher, RejectionRules
+
+NEGATIVE_GROUP = "negative_keywords"
+
+
+class ArticleAnalyzer:
+    """Rejection rules and relevance scoring fused into a single text scan
+
+    Scoring phrases (substring matches) and rejection keywords (whole-word
+    matches) share one automaton, so an article is lowercased once and walked
+    once to get its rejection verdict, keyword hits and score.
+    """
+
+    def __init__(self, keyword_categories, category_weights, negative_keywords, rejection_rules, tier_config):
+        self.keyword_categories = list(keyword_categories)
+        self.category_weights = category_weights
+        self.tier_config = tier_config
+        self.rejection = RejectionRules(rejection_rules)
+
+        groups = dict(keyword_categories)
+        groups[NEGATIVE_GROUP] = negative_keywords
+        groups.update(self.rejection.groups)
+        self.matcher = PhraseMatcher(groups, whole_word_groups=self.rejection.groups.keys())
+
+    def analyze(self, title, description, source_tier):
+        """Analyze one article, returning its verdict, keyword hits and score"""
+        content = f"{title} {description}".lower()
+
+        # Matches that end inside the leading title are the title hits
+        found = self.matcher.search(content)
+        hits = self.matcher.group_hits(found)
+        title_hits = self.matcher.group_hits(found, limit=len(title.lower()))
+
+        rejected, reason = self.rejection.evaluate(hits)
+
+        return {
+            'rejected': rejected,
+            'reason': reason,
+            'category_hits': {category: hits[category] for category in self.keyword_categories},
+            'negative_hits': hits[NEGATIVE_GROUP],
+            'title_hits': {category: title_hits[category] for category in self.keyword_categories},
+            'score': self.score(hits, title_hits, source_tier),
+        }
+
+    def score(self, hits, title_hits, source_tier):
+        """Relevance score from keyword hits (recency bonus is applied later)"""
+        score = 0
+
+        # Phrase matches, weighted by category (specific phrases count more)
+        for category in self.keyword_categories:
+            score += self.category_weights.get(category, 1) * len(hits[category])
+
+        # Bonus for multiple sustainability indicators
+        sustainability_indicators = sum(len(hits[category]) for category in self.keyword_categories)
+        if sustainability_indicators >= 3:
+            score += 3
+        elif sustainability_indicators >= 2:
+            score += 2
+
+        # Strong penalty for negative keywords
+        score -= 5 * len(hits[NEGATIVE_GROUP])
+
+        # Extra bonus for each sustainability term in the title
+        score += 2 * sum(len(title_hits[category]) for category in self.keyword_categories)
+
+        # Tier-specific bonus
+        score += self.tier_config.get(source_tier, {}).get("bonus_score", 0)
+
+        return max(0, score)
@@ -0,0 +1,172 @@
+"""Streaming access to the article archive
+
+The archive is the legacy `news_raw.json` document
+
+    {"last_updated": ..., "total_articles": N, "articles": [{...}, ...]}
+
+plus an optional JSON Lines file that new records are appended to. Both are
+read one article at a time, so memory use does not grow with the archive.
+"""
+import json
+import os
+from datetime import datetime
+
+CHUNK_SIZE = 1 << 16
+
+
+class _JSONStream:
+    """Incremental JSON tokenizer over a text file, keeping a bounded buffer"""
+
+    def __init__(self, f, chunk_size=CHUNK_SIZE):
+        self.file = f
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _read_more(self):
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character (without consuming it), '' at EOF"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._read_more():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at archive offset near {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+            # A number cut at the buffer edge decodes "successfully"; make sure
+            # the value is followed by something before trusting it
+            if end == len(self.buffer) and not self.eof and self._read_more():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_archive(path, key='articles'):
+    """Yield the articles of a JSON archive document one by one"""
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _JSONStream(f)
+        stream.expect('{')
+
+        while stream.peek() != '}':
+            name = stream.value()
+            stream.expect(':')
+
+            if name != key:
+                stream.value()  # small metadata values
+            else:
+                stream.expect('[')
+                while stream.peek() != ']':
+                    yield stream.value()
+                    if stream.peek() == ',':
+                        stream.pos += 1
+                stream.expect(']')
+
+            if stream.peek() == ',':
+                stream.pos += 1
+
+
+def iter_jsonl(path):
+    """Yield the records of a JSON Lines file, skipping blank or truncated lines"""
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                # A crash mid-append leaves a partial last line
+                continue
+
+
+def iter_all(path, jsonl_path=None):
+    """Yield every archived article: the JSON document first, then appended records"""
+    if os.path.exists(path):
+        yield from iter_archive(path)
+    if jsonl_path:
+        yield from iter_jsonl(jsonl_path)
+
+
+def append_articles(jsonl_path, articles):
+    """Append articles to the JSON Lines archive, returning how many were written"""
+    directory = os.path.dirname(jsonl_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    written = 0
+    with open(jsonl_path, 'a', encoding='utf-8') as f:
+        for article in articles:
+            f.write(json.dumps(article, ensure_ascii=False) + '\n')
+            written += 1
+    return written
+
+
+class ArchiveWriter:
+    """Write an archive document article by article (atomically on close)
+
+    The article count is only known at the end, so `total_articles` is written
+    after the array; JSON readers do not depend on key order.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.tmp_path = path + '.tmp'
+        self.count = 0
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.tmp_path, 'w', encoding='utf-8')
+        self.file.write('{\n  "last_updated": %s,\n  "articles": [' % json.dumps(datetime.now().isoformat()))
+        return self
+
+    def write(self, article):
+        self.file.write(',\n    ' if self.count else '\n    ')
+        self.file.write(json.dumps(article, ensure_ascii=False))
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            self.file.close()
+            os.remove(self.tmp_path)
+            return False
+        self.file.write('\n  ],\n  "total_articles": %d\n}\n' % self.count)
+        self.file.close()
+        os.replace(self.tmp_path, self.path)
+        return False
+
+
+def compact(path, jsonl_path):
+    """Fold the appended JSON Lines records into the archive document"""
+    with ArchiveWriter(path) as writer:
+        for article in iter_all(path, jsonl_path):
+            writer.write(article)
+    open(jsonl_path, 'w').close()
+    return writer.count
@@ -0,0 +1,97 @@
+"""Micro-benchmark: feed_parser.parse_feed (lxml iterparse) vs feedparser.parse
+
+Run from the repository root, on recorded fixtures or on feeds synthesized from the archive:
+
+    python -m benchmarks.feed_parsing --fixtures benchmarks/fixtures
+    python -m benchmarks.feed_parsing [--scale 1 10] [--archive news_raw.json] [--repeat 5]
+"""
+import argparse
+import timeit
+from itertools import islice
+
+import feedparser
+
+from benchmarks.pipeline import ITEMS_PER_SYNTHETIC_FEED, load_recorded_fixtures, synthesize_fixtures
+from feed_parser import parse_feed
+from fetch_news import TIER_CONFIG
+from text_cleaning import clean_description
+
+COMPARED_FIELDS = ('title', 'link', 'id', 'published_parsed', 'updated_parsed')
+
+
+def entry_fields(entry):
+    fields = tuple(entry.get(name) for name in COMPARED_FIELDS)
+    return fields + (clean_description(entry.get('summary', '')),)
+
+
+def mismatches(fixtures):
+    """Entries whose aggregator-visible fields differ between the two parsers"""
+    differing = total = fallbacks = 0
+    for feed_url, tier, document in fixtures:
+        limit = TIER_CONFIG[tier]['max_articles']
+        fast = parse_feed(document, feed_url, select=lambda entries: islice(entries, limit))
+        if fast is None:
+            fallbacks += 1
+            continue
+        full = feedparser.parse(document, response_headers={'content-location': feed_url})
+        for fast_entry, full_entry in zip(fast.entries, full.entries[:limit]):
+            total += 1
+            differing += entry_fields(fast_entry) != entry_fields(full_entry)
+    return differing, total, fallbacks
+
+
+def best_of(func, repeat):
+    return min(timeit.Timer(func).repeat(repeat=repeat, number=1))
+
+
+def compare(label, fixtures, repeat):
+    limits = [TIER_CONFIG[tier]['max_articles'] for _, tier, _ in fixtures]
+    documents = [document for _, _, document in fixtures]
+
+    cases = [
+        ("feedparser", lambda: [feedparser.parse(document) for document in documents]),
+        ("lxml (all)", lambda: [parse_feed(document) for document in documents]),
+        ("lxml (limit)", lambda: [
+            parse_feed(document, select=lambda entries: islice(entries, limit))
+            for document, limit in zip(documents, limits)
+        ]),
+    ]
+
+    differing, total, fallbacks = mismatches(fixtures)
+    size = sum(len(document) for document in documents)
+    print(f"\n📊 {label}: {len(documents)} feeds, {size / 1024:.0f} KiB")
+    print(f"  Field mismatches vs feedparser: {differing}/{total} entries, {fallbacks} feeds fall back")
+    print(f"  {'parser':<14} {'total ms':>10} {'speedup':>9}")
+
+    baseline = None
+    for name, func in cases:
+        seconds = best_of(func, repeat)
+        baseline = baseline or seconds
+        print(f"  {name:<14} {seconds * 1000:>10.2f} {baseline / seconds:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fixtures', help='recorded fixtures directory (default: synthesize from the archive)')
+    parser.add_argument('--archive', default='news_raw.json')
+    parser.add_argument('--scale', type=int, nargs='+', default=[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.fixtures:
+        compare("Recorded fixtures", load_recorded_fixtures(args.fixtures), args.repeat)
+        return
+
+    for scale in args.scale:
+        fixtures = synthesize_fixtures(args.archive, scale)
+        compare(f"Archive x{scale}, {ITEMS_PER_SYNTHETIC_FEED} items per feed", fixtures, args.repeat)
+
+        # One feed holding every item, like the large all-in-one publisher feeds
+        feed_url, tier, _ = fixtures[0]
+        items = b''.join(document.split(b'</title>', 1)[1].rsplit(b'</channel>', 1)[0] for _, _, document in fixtures)
+        large = b'<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel><title>Large</title>' + items + b'</channel></rss>'
+        compare(f"Archive x{scale}, single large feed", [(feed_url, tier, large)], args.repeat)
+
+
+if __name__ == '__main__':
+    main()
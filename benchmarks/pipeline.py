@@ -0,0 +1,229 @@
+"""Offline benchmark: replay feed fixtures through NewsAggregator stage by stage
+
+Record live snapshots once (this is the only step that touches the network):
+
+    python -m benchmarks.pipeline record [--fixtures benchmarks/fixtures]
+
+Replay the recordings, or synthesize feeds from the archive at several scales:
+
+    python -m benchmarks.pipeline run --fixtures benchmarks/fixtures
+    python -m benchmarks.pipeline run --scale 1 10 100 [--archive news_raw.json]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+from email.utils import format_datetime
+from xml.sax.saxutils import escape
+
+import feedparser
+
+from archive import iter_archive
+from fetch_news import NewsAggregator, RSS_FEEDS_BY_TIER, TIER_CONFIG
+from records import Article
+from registry import get_domain
+
+DEFAULT_FIXTURES = os.path.join('benchmarks', 'fixtures')
+ITEMS_PER_SYNTHETIC_FEED = 50
+
+STAGES = ['parse', 'clean', 'reject', 'score', 'dedupe', 'save']
+
+# ==================== FIXTURES ====================
+
+def record_fixtures(directory):
+    """Download every configured feed once and store the raw XML"""
+    import requests
+
+    os.makedirs(directory, exist_ok=True)
+    index = []
+
+    for tier_name, feed_list in RSS_FEEDS_BY_TIER.items():
+        for number, feed_url in enumerate(feed_list):
+            file_name = f"{tier_name}_{number}_{get_domain(feed_url)}.xml"
+            print(f"  Recording: {feed_url}", end="")
+            try:
+                response = requests.get(feed_url, timeout=(5, 30), headers={'User-Agent': 'SustainNews benchmark'})
+                response.raise_for_status()
+            except Exception as e:
+                print(f" ❌ {str(e)[:50]}")
+                continue
+
+            with open(os.path.join(directory, file_name), 'wb') as f:
+                f.write(response.content)
+            index.append({'feed_url': feed_url, 'tier': tier_name, 'file': file_name})
+            print(f" ✅ ({len(response.content)} bytes)")
+
+    with open(os.path.join(directory, 'index.json'), 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2)
+    print(f"\n✅ Recorded {len(index)} feeds to {directory}")
+
+
+def load_recorded_fixtures(directory):
+    """Return [(feed_url, tier, xml_bytes)] from a recorded fixtures directory"""
+    with open(os.path.join(directory, 'index.json'), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+
+    fixtures = []
+    for item in index:
+        with open(os.path.join(directory, item['file']), 'rb') as f:
+            fixtures.append((item['feed_url'], item['tier'], f.read()))
+    return fixtures
+
+
+def synthesize_fixtures(archive_path, scale):
+    """Build RSS documents from the archive articles, repeated `scale` times
+
+    Copies get distinct titles and URLs so deduplication still has work to do,
+    and fresh publication dates so nothing falls outside the 7-day window.
+    """
+    articles = list(iter_archive(archive_path))
+
+    now = datetime.now()
+    tiers = list(TIER_CONFIG)
+    feed_urls = [url for feed_list in RSS_FEEDS_BY_TIER.values() for url in feed_list]
+    items = []
+
+    for copy in range(scale):
+        for number, article in enumerate(articles):
+            suffix = f" ({copy})" if copy else ""
+            published = now - timedelta(minutes=number * 7 + copy)
+            items.append(
+                '<item>'
+                f'<title>{escape(article["title"] + suffix)}</title>'
+                f'<link>{escape(article["url"].split("?")[0] + (f"-{copy}" if copy else ""))}</link>'
+                f'<description>{escape(article.get("description") or "")}</description>'
+                f'<pubDate>{format_datetime(published)}</pubDate>'
+                '</item>'
+            )
+
+    fixtures = []
+    for start in range(0, len(items), ITEMS_PER_SYNTHETIC_FEED):
+        number = start // ITEMS_PER_SYNTHETIC_FEED
+        document = (
+            '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+            f'<title>Synthetic feed {number}</title>'
+            + ''.join(items[start:start + ITEMS_PER_SYNTHETIC_FEED])
+            + '</channel></rss>'
+        )
+        fixtures.append((feed_urls[number % len(feed_urls)], tiers[number % len(tiers)], document.encode('utf-8')))
+    return fixtures
+
+# ==================== BENCHMARK ====================
+
+def run_pipeline(fixtures):
+    """Run every stage over the fixtures, returning {stage: [seconds per item]} and item counts"""
+    aggregator = NewsAggregator()
+    timings = {stage: [] for stage in STAGES}
+    counts = {stage: 0 for stage in STAGES}
+    clock = time.perf_counter
+
+    for feed_url, tier_name, document in fixtures:
+        start = clock()
+        feed = feedparser.parse(document)
+        timings['parse'].append(clock() - start)
+        counts['parse'] += len(feed.entries)
+
+        for entry in feed.entries:
+            start = clock()
+            description = aggregator.get_clean_description(entry)
+            timings['clean'].append(clock() - start)
+
+            title = entry.get('title', 'No title')
+
+            start = clock()
+            rejected, _ = aggregator.should_reject_article(title, description)
+            timings['reject'].append(clock() - start)
+
+            start = clock()
+            score = aggregator.calculate_relevance_score(title, description, tier_name)
+            timings['score'].append(clock() - start)
+
+            aggregator.articles.append(Article(
+                title=title,
+                description=description,
+                url=entry.get('link', ''),
+                published_at=datetime.now().isoformat(),
+                source=aggregator.get_proper_source_name(feed_url, entry),
+                relevance_score=score,
+                source_tier=tier_name,
+            ))
+
+    for stage in ('clean', 'reject', 'score'):
+        counts[stage] = len(timings[stage])
+
+    # Whole-batch stages: one sample each, throughput over every article
+    quiet = io.StringIO()
+    counts['dedupe'] = len(aggregator.articles)
+    with contextlib.redirect_stdout(quiet):
+        start = clock()
+        aggregator.deduplicate_articles()
+        timings['dedupe'].append(clock() - start)
+
+    counts['save'] = len(aggregator.articles)
+    with tempfile.TemporaryDirectory() as output_dir, contextlib.redirect_stdout(quiet):
+        cwd = os.getcwd()
+        os.chdir(output_dir)
+        try:
+            start = clock()
+            aggregator.save_articles()
+            timings['save'].append(clock() - start)
+        finally:
+            os.chdir(cwd)
+
+    return timings, counts
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def report(label, timings, counts):
+    print(f"\n📊 {label}")
+    print(f"  {'stage':<8} {'items':>9} {'total ms':>10} {'items/s':>12} {'p50 us':>9} {'p90 us':>9} {'p99 us':>9}")
+    for stage in STAGES:
+        samples = sorted(timings[stage])
+        total = sum(samples)
+        throughput = counts[stage] / total if total else 0
+        print(
+            f"  {stage:<8} {counts[stage]:>9} {total * 1000:>10.1f} {throughput:>12.0f}"
+            f" {percentile(samples, 0.5) * 1e6:>9.1f} {percentile(samples, 0.9) * 1e6:>9.1f}"
+            f" {percentile(samples, 0.99) * 1e6:>9.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = subparsers.add_parser('record', help='download live feed snapshots')
+    record_parser.add_argument('--fixtures', default=DEFAULT_FIXTURES)
+
+    run_parser = subparsers.add_parser('run', help='replay fixtures through the pipeline')
+    run_parser.add_argument('--fixtures', help='recorded fixtures directory (default: synthesize from the archive)')
+    run_parser.add_argument('--archive', default='news_raw.json')
+    run_parser.add_argument('--scale', type=int, nargs='+', default=[1])
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_fixtures(args.fixtures)
+        return
+
+    if args.fixtures:
+        fixtures = load_recorded_fixtures(args.fixtures)
+        report(f"Recorded fixtures: {len(fixtures)} feeds", *run_pipeline(fixtures))
+        return
+
+    for scale in args.scale:
+        fixtures = synthesize_fixtures(args.archive, scale)
+        report(f"Archive x{scale}: {len(fixtures)} synthetic feeds", *run_pipeline(fixtures))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""Micro-benchmark: text_cleaning.clean_description vs the previous inline cleaner
+
+Run from the repository root:
+
+    python -m benchmarks.text_cleaning [--repeat 7] [--archive news_raw.json]
+"""
+import argparse
+import html
+import re
+import timeit
+
+from archive import iter_archive
+from text_cleaning import clean_description
+
+
+def legacy_clean_description(description):
+    """The cleaner as it used to live in NewsAggregator.get_clean_description"""
+    clean_desc = html.unescape(description)
+    clean_desc = re.sub('<[^<]+?>', '', clean_desc)
+    clean_desc = re.sub(r'\[\s*…\s*\]|\[\s*\.\.\.\s*\]', '', clean_desc).strip()
+
+    if len(clean_desc) > 200:
+        if '.' in clean_desc[:150]:
+            sentences = clean_desc.split('.')
+            if len(sentences[0]) < 150:
+                clean_desc = sentences[0] + '.'
+            else:
+                clean_desc = clean_desc[:147] + '...'
+        else:
+            clean_desc = clean_desc[:197] + '...'
+
+    return clean_desc.strip()
+
+
+def with_heavy_markup(text):
+    """Wrap archive text the way markup-heavy feeds (WordPress, Medium) deliver it"""
+    paragraphs = ''.join(f'<p class="body">{html.escape(part)}.</p>\n' for part in text.split('. '))
+    return (
+        '<div class="entry"><figure><img src="https://example.com/a.jpg" alt="" /></figure>\n'
+        f'{paragraphs}'
+        '<ul><li><a href="https://example.com/1">Related</a></li><li><a href="https://example.com/2">More</a></li></ul>\n'
+        '<script>track("rss")</script><p>The post <a href="https://example.com">appeared first</a> [&#8230;]</p></div>'
+    )
+
+
+def load_descriptions(path):
+    return [article.get('description') or '' for article in iter_archive(path)]
+
+
+def best_of(func, corpus, repeat):
+    timer = timeit.Timer(lambda: [func(text) for text in corpus])
+    return min(timer.repeat(repeat=repeat, number=1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--archive', default='news_raw.json')
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    plain = load_descriptions(args.archive)
+    heavy = [with_heavy_markup(text) for text in plain]
+
+    mismatches = sum(legacy_clean_description(text) != clean_description(text) for text in plain + heavy)
+    print(f"Entries: {len(plain)} plain, {len(heavy)} markup-heavy; regex path mismatches vs legacy: {mismatches}")
+
+    cases = [
+        ("plain", "legacy", plain, legacy_clean_description),
+        ("plain", "regex", plain, clean_description),
+        ("markup", "legacy", heavy, legacy_clean_description),
+        ("markup", "regex", heavy, clean_description),
+        ("markup", "lxml", heavy, lambda text: clean_description(text, lxml_min_tags=1)),
+    ]
+
+    print(f"\n{'corpus':<8} {'cleaner':<8} {'total ms':>10} {'us/entry':>10}")
+    for corpus_name, cleaner_name, corpus, func in cases:
+        seconds = best_of(func, corpus, args.repeat)
+        print(f"{corpus_name:<8} {cleaner_name:<8} {seconds * 1000:>10.2f} {seconds / len(corpus) * 1e6:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
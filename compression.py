@@ -0,0 +1,57 @@
+import gzip
+import os
+
+from json_store import write_atomic
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; .br siblings are skipped without it
+    brotli = None
+
+# Sibling suffixes written next to an output file
+SUFFIXES = ('.gz', '.br')
+
+
+def compress(data, encoding):
+    """Compress bytes at the maximum level; output is deterministic for identical input"""
+    if encoding == 'gz':
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == 'br':
+        return brotli.compress(data, mode=brotli.MODE_TEXT, quality=11)
+    raise ValueError(f"Unknown encoding: {encoding}")
+
+
+def available(encodings):
+    """The requested encodings this environment can produce"""
+    return [encoding for encoding in encodings if encoding != 'br' or brotli is not None]
+
+
+def precompress(path, encodings, data=None):
+    """Write pre-compressed siblings (path.gz, path.br) of a file, returning {encoding: bytes}
+
+    Always includes the uncompressed size under 'raw'. Siblings of encodings
+    not requested are removed, so a stale .gz never outlives its file's update.
+    `data` gives the content for a file that is about to be written.
+    """
+    if data is None:
+        with open(path, 'rb') as f:
+            data = f.read()
+
+    for suffix in SUFFIXES:
+        if suffix[1:] not in encodings and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    sizes = {'raw': len(data)}
+    for encoding in encodings:
+        body = compress(data, encoding)
+        write_atomic(f"{path}.{encoding}", body)
+        sizes[encoding] = len(body)
+    return sizes
+
+
+def base_name(name):
+    """File name without a pre-compression suffix"""
+    for suffix in SUFFIXES:
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+
+from analysis import ArticleAnalyzer
+from registry import FeedRegistry
+
+# Config file keys; each one overrides the built-in constant of the same name
+SECTIONS = (
+    'rss_feeds_by_tier',
+    'tier_config',
+    'keyword_categories',
+    'category_weights',
+    'rejection_rules',
+    'negative_keywords',
+    'source_name_map',
+    'default_tier',
+)
+
+# Sections whose changes invalidate all cached scores. The feed list is not
+# one: a feed moved to another tier is re-scored by itself, since the caches
+# only reuse an entry for the tier it was scored for.
+SCORING_SECTIONS = (
+    'tier_config',
+    'keyword_categories',
+    'category_weights',
+    'rejection_rules',
+    'negative_keywords',
+    'source_name_map',
+)
+
+
+class CompiledConfig:
+    """Configuration sections plus the matchers and lookup tables built from them"""
+
+    def __init__(self, sections):
+        self.sections = sections
+        self.feeds_by_tier = sections['rss_feeds_by_tier']
+        self.tier_config = sections['tier_config']
+
+        missing = [tier for tier in self.feeds_by_tier if tier not in self.tier_config]
+        if missing:
+            raise ValueError(f"No tier_config for tiers: {', '.join(missing)}")
+
+        self.analyzer = ArticleAnalyzer(
+            sections['keyword_categories'],
+            sections['category_weights'],
+            sections['negative_keywords'],
+            sections['rejection_rules'],
+            self.tier_config,
+        )
+        self.registry = FeedRegistry(self.feeds_by_tier, sections['source_name_map'], sections['default_tier'])
+
+        scoring = [sections[name] for name in SCORING_SECTIONS]
+        self.rules_version = hashlib.md5(json.dumps(scoring, sort_keys=True).encode()).hexdigest()
+
+    def feed_urls(self):
+        """Every configured feed URL, in tier order"""
+        return [url for feed_list in self.feeds_by_tier.values() for url in feed_list]
+
+
+def parse_config(path, data):
+    """Parse config file bytes by extension: .json, .yaml/.yml or .toml"""
+    extension = os.path.splitext(path)[1].lower()
+
+    if extension == '.json':
+        return json.loads(data.decode('utf-8'))
+
+    if extension in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError("PyYAML is required for YAML config files (pip install pyyaml)")
+        return yaml.safe_load(data) or {}
+
+    if extension == '.toml':
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError("tomli is required for TOML config files on Python < 3.11")
+        return tomllib.loads(data.decode('utf-8'))
+
+    raise ValueError(f"Unsupported config format: {path}")
+
+
+class ConfigLoader:
+    """Load the config file and keep its compiled form until the file changes
+
+    Every get() is a stat() call; the file is only re-read when its mtime or
+    size changed, and only recompiled when its content hash changed. A broken
+    edit, or a file that is briefly missing, keeps the last good configuration.
+    """
+
+    def __init__(self, default, path=None):
+        self.default = default
+        self.path = path
+        self.compiled = default
+        self._stat = None
+        self._digest = None
+
+    def get(self):
+        """Current compiled configuration"""
+        if not self.path:
+            return self.default
+
+        try:
+            stat = os.stat(self.path)
+            stat_key = (stat.st_mtime_ns, stat.st_size)
+            if stat_key == self._stat:
+                return self.compiled
+
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            if self._digest is None:
+                raise
+            print(f"⚠️  Ignoring invalid config {self.path}: {e}")
+            return self.compiled
+        self._stat = stat_key
+
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self._digest:
+            return self.compiled
+
+        try:
+            overrides = parse_config(self.path, data)
+            unknown = set(overrides) - set(SECTIONS)
+            if unknown:
+                raise ValueError(f"Unknown config sections: {', '.join(sorted(unknown))}")
+            compiled = CompiledConfig({**self.default.sections, **overrides})
+        except Exception as e:
+            if self._digest is None:
+                raise
+            print(f"⚠️  Ignoring invalid config {self.path}: {e}")
+            return self.compiled
+
+        self._digest = digest
+        self.compiled = compiled
+        print(f"⚙️  Loaded config from {self.path}")
+        return compiled
+
+
+def dump_config(config, path):
+    """Write a config's sections as JSON, as a starting point for a config file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config.sections, f, indent=2, ensure_ascii=False)
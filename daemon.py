@@ -0,0 +1,204 @@
+import hashlib
+import json
+import statistics
+import time
+from calendar import timegm
+
+# sy:updatePeriod values in seconds
+UPDATE_PERIODS = {
+    'hourly': 3600,
+    'daily': 86400,
+    'weekly': 7 * 86400,
+    'monthly': 30 * 86400,
+    'yearly': 365 * 86400,
+}
+
+# Unchanged feeds are polled this much less often each time (up to max_interval)
+UNCHANGED_BACKOFF = 1.5
+
+
+def declared_interval(feed):
+    """Publisher hints as (ttl seconds, sy:updatePeriod/Frequency seconds)"""
+    channel = feed.get('feed', {})
+    ttl = None
+    if str(channel.get('ttl', '')).strip().isdigit():
+        ttl = int(channel['ttl']) * 60
+
+    syndication = None
+    period = UPDATE_PERIODS.get(str(channel.get('sy_updateperiod', '')).strip().lower())
+    if period:
+        frequency = str(channel.get('sy_updatefrequency', '1')).strip()
+        syndication = period / max(1, int(frequency) if frequency.isdigit() else 1)
+
+    return ttl, syndication
+
+
+def observed_interval(feed):
+    """Median gap between the feed's entry timestamps, in seconds"""
+    timestamps = []
+    for entry in feed.get('entries', []):
+        parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+        if parsed:
+            timestamps.append(timegm(parsed))
+    timestamps.sort()
+    gaps = [later - earlier for earlier, later in zip(timestamps, timestamps[1:]) if later > earlier]
+    return statistics.median(gaps) if gaps else None
+
+
+class FeedScheduler:
+    """Per-feed polling schedule
+
+    A feed's interval comes from how often it actually publishes, or from its
+    sy:updatePeriod hint, never below its <ttl>, clamped to the configured
+    bounds. Feeds that come back unchanged are polled progressively less often.
+    """
+
+    def __init__(self, default_interval, min_interval, max_interval):
+        self.default_interval = default_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.intervals = {}
+        self.next_due = {}
+
+    def sync(self, feed_urls, now):
+        """Track newly configured feeds (due immediately) and forget removed ones"""
+        for url in feed_urls:
+            if url not in self.next_due:
+                self.next_due[url] = now
+                self.intervals[url] = self.default_interval
+        for url in set(self.next_due) - set(feed_urls):
+            del self.next_due[url]
+            del self.intervals[url]
+
+    def poll_now(self, url, now):
+        """Make a tracked feed due immediately"""
+        if url in self.next_due:
+            self.next_due[url] = now
+
+    def due(self, now):
+        return [url for url, due_at in self.next_due.items() if due_at <= now]
+
+    def seconds_until_next(self, now):
+        if not self.next_due:
+            return self.default_interval
+        return max(0, min(self.next_due.values()) - now)
+
+    def _clamp(self, interval):
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def update(self, url, feed, now, changed):
+        """Reschedule a feed after a successful poll"""
+        if changed:
+            ttl, syndication = declared_interval(feed)
+            interval = observed_interval(feed) or syndication or self.default_interval
+            if ttl:
+                interval = max(interval, ttl)
+        else:
+            interval = self.intervals[url] * UNCHANGED_BACKOFF
+
+        self.intervals[url] = self._clamp(interval)
+        self.next_due[url] = now + self.intervals[url]
+
+    def failed(self, url, now):
+        """Reschedule a feed after an error"""
+        self.intervals[url] = self._clamp(self.default_interval)
+        self.next_due[url] = now + self.intervals[url]
+
+
+def articles_signature(articles):
+    """Hash of the accepted set, independent of ordering"""
+    rows = sorted((a.url, a.title, a.relevance_score, a.published_at) for a in articles)
+    return hashlib.md5(json.dumps(rows, ensure_ascii=False).encode()).hexdigest()
+
+
+def run_daemon(aggregator, default_interval, min_interval, max_interval, max_sleep=60, max_cycles=None):
+    """Keep the aggregator warm, poll each feed on its own schedule and save on change"""
+    scheduler = FeedScheduler(default_interval, min_interval, max_interval)
+    feed_candidates = {}
+    feed_tiers = {}  # Tier each feed's candidates were scored for
+    last_signature = None
+    cycles = 0
+
+    print("🛰️  Starting SustainNews daemon (Ctrl+C to stop)")
+
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            # A failing cycle (config, cache or output errors) is retried after
+            # a pause instead of stopping the daemon
+            try:
+                aggregator.start_run()
+                now = time.time()
+                scheduler.sync(aggregator.config.feed_urls(), now)
+
+                # A config reload that moved a feed to another tier invalidates its
+                # candidates (tier and bonus are baked into their scores)
+                for url, tier in list(feed_tiers.items()):
+                    if aggregator.get_source_tier(url) != tier:
+                        feed_candidates.pop(url, None)
+                        del feed_tiers[url]
+                        scheduler.poll_now(url, now)
+
+                due = []
+                for url in scheduler.due(now):
+                    if aggregator.feed_health.allow(url, now):
+                        due.append(url)
+                    else:
+                        scheduler.failed(url, now)
+                        feed_candidates.pop(url, None)
+
+                if due:
+                    cycles += 1
+                    aggregator.stats = aggregator.new_stats()
+                    print(f"\n📡 Polling {len(due)} due feeds")
+
+                    downloads = aggregator.download_feeds(due)
+                    for url in due:
+                        feed, error = downloads[url]
+                        problem = aggregator.record_download(url, feed, error)
+                        if problem is not None:
+                            print(f"  ❌ {aggregator.get_domain_name(url)}: {problem[:50]}")
+                            scheduler.failed(url, now)
+                            continue
+
+                        previous = feed_candidates.get(url)
+                        tier = aggregator.get_source_tier(url)
+                        try:
+                            candidates = aggregator.get_feed_candidates(feed, url, tier)
+                        except Exception as e:
+                            print(f"  ❌ {aggregator.get_domain_name(url)}: Error: {str(e)[:50]}")
+                            aggregator.feed_health.record_failure(url, str(e) or type(e).__name__)
+                            aggregator.metrics.count("feed_errors_total", feed=url)
+                            scheduler.failed(url, now)
+                            continue
+                        feed_candidates[url] = candidates
+                        feed_tiers[url] = tier
+                        scheduler.update(url, feed, now, changed=candidates != previous)
+
+                    aggregator.feed_cache.save()
+                    aggregator.seen_index.save()
+                    aggregator.feed_health.save()
+
+                    aggregator.rebuild_articles(feed_candidates)
+                    aggregator.deduplicate_articles()
+
+                    signature = articles_signature(aggregator.articles)
+                    if signature != last_signature:
+                        aggregator.process_articles()
+                        aggregator.save_articles()
+                        last_signature = signature
+                    else:
+                        print("💤 Accepted articles unchanged, not re-saving")
+            except Exception as e:
+                print(f"❌ Daemon cycle failed: {e}")
+                time.sleep(max_sleep)
+                continue
+
+            wait = min(max_sleep, scheduler.seconds_until_next(time.time()))
+            if wait > 0 and (max_cycles is None or cycles < max_cycles):
+                time.sleep(wait)
+    except KeyboardInterrupt:
+        print("\n👋 Stopping daemon")
+    finally:
+        aggregator.feed_cache.save()
+        aggregator.seen_index.save()
+        aggregator.feed_health.save()
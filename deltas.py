@@ -0,0 +1,90 @@
+import json
+import os
+import time
+
+from compression import base_name
+from shards import read_manifest, write_addressed
+
+DELTA_DIR = 'deltas'
+
+
+def load_published(directory):
+    """The currently published set as (manifest, {article id: article})
+
+    Either part is None when it cannot be read; a manifest whose shards are
+    missing or predate article ids still comes back with articles None.
+    """
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return None, None
+
+    articles = {}
+    try:
+        for name in manifest['orders']['relevance']['files']:
+            with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                for article in json.load(f)['articles']:
+                    articles[article['id']] = article
+    except (OSError, ValueError, KeyError):  # Missing shards, or output from before articles had ids
+        return manifest, None
+    return manifest, articles
+
+
+def next_version(previous=0):
+    """Version number for a new publish, above `previous` and never issued before
+
+    Versions are seconds since the epoch, so a publish that lost the previous
+    manifest still cannot reuse a number a client has stored.
+    """
+    return max(previous + 1, int(time.time()))
+
+
+def diff_articles(previous, current):
+    """Changes from one published set to the next, keyed by article id
+
+    Articles whose only change is their score are listed as {id: score}
+    under `rescored`; any other change resends the whole article.
+    """
+    delta = {'added': [], 'updated': [], 'removed': [], 'rescored': {}}
+    for article_id, article in current.items():
+        old = previous.get(article_id)
+        if old is None:
+            delta['added'].append(article)
+        elif old != article:
+            if {**old, 'score': article['score']} == article:
+                delta['rescored'][article_id] = article['score']
+            else:
+                delta['updated'].append(article)
+    delta['removed'] = [article_id for article_id in previous if article_id not in current]
+    return delta
+
+
+def is_empty(delta):
+    return not any(delta.values())
+
+
+def write_delta(directory, previous_version, delta, total, chain, keep):
+    """Write the delta to the next version, returning (version, updated chain of recent deltas)
+
+    The chain lists the last `keep` deltas oldest first; a client on any
+    version in it can catch up by applying the deltas after it in order.
+    Delta files that fell off the chain are removed.
+    """
+    delta_dir = os.path.join(directory, DELTA_DIR)
+    os.makedirs(delta_dir, exist_ok=True)
+
+    version = next_version(previous_version)
+    name = write_addressed(delta_dir, f"delta-{version}", {'from': previous_version, 'to': version, 'total': total, **delta})
+
+    entry = {
+        'from': previous_version,
+        'to': version,
+        'file': f"{DELTA_DIR}/{name}",
+        'bytes': os.path.getsize(os.path.join(delta_dir, name)),
+    }
+    chain = (chain + [entry])[-keep:]
+
+    kept = {os.path.basename(link['file']) for link in chain}
+    for existing in os.listdir(delta_dir):
+        if base_name(existing).endswith('.json') and base_name(existing) not in kept:
+            os.remove(os.path.join(delta_dir, existing))
+    return version, chain
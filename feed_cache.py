@@ -0,0 +1,63 @@
+from json_store import read_json, write_json
+
+
+class FeedCache:
+    """Persistent HTTP validator store (ETag / Last-Modified) keyed by feed URL
+
+    Alongside the validators we keep the articles each feed produced on its
+    last full fetch, so a feed answering 304 Not Modified can be replayed
+    without downloading, parsing or scoring it again. Those articles carry
+    the tier (and its bonus) the feed had then, so entries only count for
+    the same tier.
+    """
+
+    def __init__(self, path, rules_version=""):
+        self.path = path
+        self.rules_version = rules_version
+        self.feeds = {}
+        self.load()
+
+    def load(self):
+        """Load the cache file; a missing, corrupt or stale cache starts empty"""
+        data = read_json(self.path) or {}
+
+        # Cached articles were scored with the rules of that run; drop them
+        # when the keyword configuration has changed since
+        if data.get('rules_version') == self.rules_version:
+            self.feeds = data.get('feeds', {})
+
+    def save(self):
+        """Write the cache back to disk"""
+        write_json(self.path, {'rules_version': self.rules_version, 'feeds': self.feeds})
+
+    def validators(self, feed_url, tier):
+        """Return the (etag, modified) pair to send for a conditional GET
+
+        A feed moved to another tier gets none, so it is downloaded and
+        scored again instead of replaying articles scored for the old tier.
+        """
+        cached = self.feeds.get(feed_url)
+        if not cached or cached.get('tier') != tier:
+            return None, None
+        return cached.get('etag'), cached.get('modified')
+
+    def candidates(self, feed_url):
+        """Return the articles stored from the last full fetch of a feed"""
+        return self.feeds.get(feed_url, {}).get('candidates', [])
+
+    def store(self, feed_url, feed, candidates, tier):
+        """Remember a feed's validators and the articles it produced as part of a tier"""
+        etag = feed.get('etag')
+        modified = feed.get('modified')
+
+        # Without validators the server can never answer 304, so don't bother
+        if not etag and not modified:
+            self.feeds.pop(feed_url, None)
+            return
+
+        self.feeds[feed_url] = {
+            'etag': etag,
+            'modified': modified,
+            'tier': tier,
+            'candidates': candidates,
+        }
@@ -0,0 +1,83 @@
+import time
+
+from json_store import read_json, write_json
+
+CLOSED = 'closed'        # Feed is polled normally
+OPEN = 'open'            # Feed is skipped until its cool-down ends
+HALF_OPEN = 'half_open'  # Cool-down over; the next poll is a probe
+
+
+class FeedHealth:
+    """Persistent per-feed health store with a circuit breaker
+
+    Consecutive failures are counted per feed. Once a feed reaches
+    failure_threshold the circuit opens and the feed is skipped for a
+    cool-down that doubles with every further failure (up to max_cooldown).
+    When the cool-down ends a single probe is let through: success closes
+    the circuit, failure re-opens it for longer.
+    """
+
+    def __init__(self, path, failure_threshold=2, base_cooldown=12 * 3600, max_cooldown=14 * 86400):
+        self.path = path
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = base_cooldown
+        self.max_cooldown = max_cooldown
+        self.feeds = {}
+        self.load()
+
+    def load(self):
+        """Load the health file; a missing or corrupt file starts empty"""
+        self.feeds = (read_json(self.path) or {}).get('feeds', {})
+
+    def save(self):
+        """Write the health store back to disk"""
+        write_json(self.path, {'feeds': self.feeds}, indent=2)
+
+    def allow(self, feed_url, now=None):
+        """Whether a feed should be polled now; moves expired open circuits to half-open"""
+        record = self.feeds.get(feed_url)
+        if record is None or record['state'] == CLOSED:
+            return True
+
+        now = time.time() if now is None else now
+        if record['state'] == OPEN and now < record['open_until']:
+            return False
+
+        record['state'] = HALF_OPEN
+        return True
+
+    def record_success(self, feed_url, now=None):
+        """Close the circuit and reset the failure count"""
+        record = self.feeds.setdefault(feed_url, {'failures': 0, 'last_error': None, 'last_failure': None})
+        record.update({
+            'state': CLOSED,
+            'failures': 0,
+            'open_until': None,
+            'last_success': time.time() if now is None else now,
+        })
+
+    def record_failure(self, feed_url, reason, now=None):
+        """Count a failure and open the circuit once the threshold is reached"""
+        now = time.time() if now is None else now
+        record = self.feeds.setdefault(feed_url, {'state': CLOSED, 'failures': 0, 'last_success': None})
+        record['failures'] += 1
+        record['last_error'] = reason
+        record['last_failure'] = now
+
+        if record['failures'] >= self.failure_threshold:
+            cooldown = self.base_cooldown * 2 ** (record['failures'] - self.failure_threshold)
+            record['state'] = OPEN
+            record['open_until'] = now + min(cooldown, self.max_cooldown)
+        else:
+            record['state'] = CLOSED
+            record['open_until'] = None
+
+    def problems(self):
+        """Feeds with outstanding failures, worst first"""
+        failing = [(url, record) for url, record in self.feeds.items() if record['failures']]
+        return sorted(failing, key=lambda item: -item[1]['failures'])
+
+    def forget(self, feed_urls):
+        """Drop records of feeds that are no longer configured"""
+        for url in set(self.feeds) - set(feed_urls):
+            del self.feeds[url]
@@ -0,0 +1,134 @@
+from io import BytesIO
+from urllib.parse import urljoin
+
+import feedparser
+from feedparser.datetimes import _parse_date
+
+try:
+    from lxml import etree
+except ImportError:  # lxml is optional; feedparser handles every feed
+    etree = None
+
+RSS1_NS = 'http://purl.org/rss/1.0/'
+ATOM_NS = 'http://www.w3.org/2005/Atom'
+DC_NS = 'http://purl.org/dc/elements/1.1/'
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+SY_NS = 'http://purl.org/rss/1.0/modules/syndication/'
+
+ITEM_TAGS = ('item', f'{{{RSS1_NS}}}item', f'{{{ATOM_NS}}}entry')
+CHANNEL_TAGS = {
+    'ttl': 'ttl',
+    f'{{{SY_NS}}}updatePeriod': 'sy_updateperiod',
+    f'{{{SY_NS}}}updateFrequency': 'sy_updatefrequency',
+}
+
+# Child element -> entry field, first match wins (feedparser falls back to content for summary)
+FIELD_TAGS = {
+    'title': ('title', f'{{{RSS1_NS}}}title', f'{{{ATOM_NS}}}title'),
+    'id': ('guid', f'{{{ATOM_NS}}}id'),
+    'summary': (
+        'description', f'{{{RSS1_NS}}}description', f'{{{ATOM_NS}}}summary',
+        f'{{{CONTENT_NS}}}encoded', f'{{{ATOM_NS}}}content',
+    ),
+    'published': ('pubDate', f'{{{ATOM_NS}}}published'),
+    'updated': (f'{{{ATOM_NS}}}updated', f'{{{DC_NS}}}date'),
+}
+LINK_TAGS = ('link', f'{{{RSS1_NS}}}link')
+ATOM_LINK_TAG = f'{{{ATOM_NS}}}link'
+
+
+def _text(element):
+    if len(element):  # Atom type="xhtml" content is a child element tree
+        return ''.join(element.itertext()).strip()
+    return (element.text or '').strip()
+
+
+def _entry(item, base_url):
+    """The fields the aggregator reads from an entry, in feedparser's shape"""
+    children = {}
+    for child in item:
+        children.setdefault(child.tag, child)
+
+    entry = feedparser.FeedParserDict()
+    for field, tags in FIELD_TAGS.items():
+        for tag in tags:
+            if tag in children:
+                entry[field] = _text(children[tag])
+                break
+
+    for date_field in ('published', 'updated'):
+        if date_field in entry:
+            entry[f'{date_field}_parsed'] = _parse_date(entry[date_field])
+
+    for tag in LINK_TAGS:
+        if tag in children:
+            entry['link'] = _text(children[tag])
+            break
+    else:
+        for link in item.iterchildren(ATOM_LINK_TAG):
+            if link.get('rel', 'alternate') == 'alternate' and link.get('href'):
+                entry['link'] = urljoin(base_url, link.get('href').strip())
+                break
+        else:
+            guid = children.get('guid')
+            if guid is not None and guid.get('isPermaLink', 'true') != 'false' and entry.get('id'):
+                entry['link'] = entry['id']
+
+    return entry
+
+
+def iter_entries(body, base_url='', channel=None):
+    """Lazily yield the entries of an RSS/Atom document in document order
+
+    Only reads title, link, id, summary and dates, the fields the aggregator
+    uses, and parses no further than the consumer asks for. Channel polling
+    hints are stored into `channel` as they are reached. Raises
+    etree.XMLSyntaxError when the document turns out to be malformed.
+    """
+    events = etree.iterparse(
+        BytesIO(body), events=('end',), tag=ITEM_TAGS + tuple(CHANNEL_TAGS),
+        resolve_entities=False, no_network=True,
+    )
+
+    for _, element in events:
+        if element.tag in CHANNEL_TAGS:
+            if channel is not None:
+                channel[CHANNEL_TAGS[element.tag]] = _text(element)
+            continue
+
+        yield _entry(element, base_url)
+
+        # Drop parsed items so memory stays flat on huge feeds
+        element.clear()
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+def parse_feed(body, base_url='', select=None):
+    """Parse a feed with lxml into feedparser's shape, keeping only selected entries
+
+    `select` receives the lazy entry iterator and returns the entries to
+    keep; parsing stops as soon as it stops consuming. Returns None when
+    lxml is missing or the document is not well-formed XML with items, so
+    callers can fall back to feedparser.
+    """
+    if etree is None:
+        return None
+
+    channel = feedparser.FeedParserDict()
+    found = False
+
+    def entries():
+        nonlocal found
+        for entry in iter_entries(body, base_url, channel):
+            found = True
+            yield entry
+
+    try:
+        selected = list(select(entries()) if select else entries())
+    except etree.XMLSyntaxError:
+        return None
+
+    if not found:
+        return None
+    return feedparser.FeedParserDict(bozo=False, entries=selected, feed=channel)
@@ -1,13 +1,34 @@
-import html
+import argparse
 import feedparser
 import json
 import os
 from datetime import datetime, timedelta
 import hashlib
-import re
-from urllib.parse import urlparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import time
 
+from archive import append_articles
+from compression import available, precompress
+from config_loader import CompiledConfig, ConfigLoader, dump_config
+from deltas import diff_articles, is_empty, load_published, next_version, write_delta
+from daemon import run_daemon
+from feed_cache import FeedCache
+from feed_health import FeedHealth
+from feed_parser import parse_feed
+from http_fetch import FeedFetcher
+from instrumentation import Metrics, timed
+from near_duplicates import find_clusters
+from records import Article
+from registry import get_domain
+from search_index import SearchIndex
+from seen_index import SeenIndex
+from shards import (
+    article_id, content_hash, frontend_article, publish_manifest, read_manifest, serialize, write_addressed,
+    write_shards,
+)
+from text_cleaning import clean_description
+
 # ==================== CONFIGURATION ====================
 
 # RSS FEEDS ORGANIZED BY TIER FOR BETTER FILTERING
@@ -77,6 +98,72 @@ TIER_CONFIG = {
     }
 }
 
+# FETCH CONFIGURATION - Concurrency and politeness limits for feed downloads
+FETCH_CONFIG = {
+    "max_workers": 8,       # Global limit on feeds downloaded at the same time (1 = sequential)
+    "per_host_limit": 1,    # Concurrent requests allowed against a single host
+    "request_delay": 0.5,   # Seconds to wait between requests to the same host
+    "lxml_min_tags": None,  # Clean descriptions with at least this many tags via lxml (None = never)
+    "connect_timeout": 5,   # Seconds to establish a connection
+    "read_timeout": 20,     # Seconds to wait for each chunk of the response
+    "total_timeout": 60,    # Hard limit on a single feed download
+    "max_feed_bytes": 10 * 1024 * 1024,  # Larger (decompressed) feeds are abandoned
+    "fast_parser": True,    # Parse with lxml iterparse, falling back to feedparser for malformed feeds
+    "stale_run": 5,         # Stop reading a feed after this many consecutive entries older than the window
+}
+
+# Local state kept between runs (restored by the workflow's cache step)
+CACHE_DIR = '.cache'
+FEED_CACHE_PATH = os.path.join(CACHE_DIR, 'feed_cache.json')
+SEEN_INDEX_PATH = os.path.join(CACHE_DIR, 'seen_articles.sqlite')
+FEED_HEALTH_PATH = os.path.join(CACHE_DIR, 'feed_health.json')
+SEARCH_INDEX_PATH = os.path.join(CACHE_DIR, 'search_index.json')
+
+# Circuit breaker for failing feeds
+HEALTH_CONFIG = {
+    "failure_threshold": 2,          # Consecutive failures before a feed is skipped
+    "base_cooldown": 12 * 3600,      # First skip window (seconds), doubled per further failure
+    "max_cooldown": 14 * 86400,      # Dead feeds are still probed every two weeks
+}
+
+# Only articles published within this window are kept
+MAX_ARTICLE_AGE = timedelta(days=7)
+
+# Near-duplicate detection (syndicated stories with reworded headlines)
+DEDUPE_CONFIG = {
+    # Exact Jaccard similarity of title + description word pairs. Templated stories
+    # (ETF distribution notices, daily "Comet Tracker" columns) reach 0.5-0.6 while
+    # re-posts of one story score 0.75+; lower values merge, and drop, distinct articles
+    "similarity_threshold": 0.7,
+    "shingle_size": 2,            # Words per shingle
+    "num_perm": 64,               # MinHash signature length
+    "bands": 16,                  # LSH bands (num_perm / bands rows each)
+}
+
+# Article archive: legacy JSON document plus an append-only JSON Lines file
+ARCHIVE_PATH = 'news_raw.json'
+ARCHIVE_APPEND_PATH = None  # e.g. 'news_raw.jsonl' to archive every run's articles
+
+# Daemon mode: per-feed polling bounds (seconds)
+DAEMON_CONFIG = {
+    "default_interval": 3600,   # Until a feed's own update rhythm is known
+    "min_interval": 600,        # Never poll a feed more often than this
+    "max_interval": 86400,      # Poll even the slowest feeds at least daily
+}
+
+# Frontend output: page shards plus manifest, and the capped legacy news.json
+OUTPUT_CONFIG = {
+    "shard_dir": "news",        # Manifest and page shards for the web frontend
+    "shard_size": 45,           # Articles per shard (5 pages of the 9-card grid)
+    "legacy_limit": 100,        # news.json keeps its old cap for existing clients
+    "search_index": "search-index",       # Inverted index for client-side search, in shard_dir
+    "delta_chain": 10,          # Recent version-to-version deltas kept for returning clients
+    "precompress": (),          # e.g. ("gz", "br") to write .gz/.br siblings for static servers
+}
+
+# Run metrics: always embedded in news_detailed.json, optionally also as Prometheus text
+METRICS_PROMETHEUS_PATH = None  # e.g. 'metrics.prom'
+
 # ENHANCED KEYWORD SYSTEM WITH CONTEXTUAL PHRASES
 KEYWORD_CATEGORIES = {
     # Environmental action (strong indicators)
@@ -110,14 +197,23 @@ KEYWORD_CATEGORIES = {
     ]
 }
 
+# Points per matched phrase in each keyword category
+CATEGORY_WEIGHTS = {
+    "environmental_action": 4,   # Strong bonus for specific phrases
+    "esg_reporting": 4,
+    "fashion_sustainability": 3,
+    "general_keywords": 1,       # Weaker matches
+}
+
 # STRONG REJECTION RULES - Immediate exclusion
 REJECTION_RULES = [
     # Pattern: (check_type, keywords, [optional context checks])
+    # Keywords match whole words (plural "s" allowed); a trailing "*" matches any ending
     ("any", ["election", "trump", "biden", "vote", "campaign", "senate", "congress"]),
     ("any", ["football", "soccer", "basketball", "nfl", "nba", "sports", "olympics"]),
     ("any", ["celebrity", "movie", "hollywood", "oscar", "netflix", "entertainment"]),
     ("any", ["crime", "murder", "shooting", "arrest", "lawsuit", "investigation"]),
-    ("any", ["crypto", "bitcoin", "ethereum", "blockchain", "nft"]),
+    ("any", ["crypto*", "bitcoin", "ethereum", "blockchain", "nft"]),
     ("any", ["recipe", "cooking", "restaurant", "food", "diet"]),
     
     # Contextual rejection: "green" in financial context
@@ -130,10 +226,10 @@ REJECTION_RULES = [
     ("any", ["gaza", "ukraine", "war", "humanitarian crisis", "genocide"]),
     
     # New rule: Reject articles that are purely animal photo galleries or non-substantive wildlife features
-    ("context", ["wildlife", "photograph"], ["week in", "gallery", "photo", "picture of"]),
+    ("context", ["wildlife", "photograph*"], ["week in", "gallery", "photo", "picture of"]),
     
     # New rule: Reject obscure scientific studies unrelated to environment/sustainability
-    ("context", ["study", "scientists"], ["monogam", "human behavior", "league table"]),
+    ("context", ["study", "scientists"], ["monogam*", "human behavior", "league table"]),
 ]
 
 # NEGATIVE KEYWORDS (strong penalty)
@@ -176,33 +272,124 @@ SOURCE_NAME_MAP = {
     'commonobjective.co': 'Common Objective',
 }
 
+# ==================== COMPILED CONFIGURATION ====================
+
+# Built-in configuration; a config file (--config) can override any section
+DEFAULT_SECTIONS = {
+    'rss_feeds_by_tier': RSS_FEEDS_BY_TIER,
+    'tier_config': TIER_CONFIG,
+    'keyword_categories': KEYWORD_CATEGORIES,
+    'category_weights': CATEGORY_WEIGHTS,
+    'rejection_rules': REJECTION_RULES,
+    'negative_keywords': NEGATIVE_KEYWORDS,
+    'source_name_map': SOURCE_NAME_MAP,
+    'default_tier': "tier4_general_news",  # Tier for feeds not listed above
+}
+
+# Matchers and lookup tables compiled once at import
+DEFAULT_CONFIG = CompiledConfig(DEFAULT_SECTIONS)
+
+
+def analyze(title, description, tier):
+    """Rejection verdict, keyword hits and relevance score of an article in one pass"""
+    return DEFAULT_CONFIG.analyzer.analyze(title, description, tier)
+
+# ==================== FETCH HELPERS ====================
+
+class HostLimiter:
+    """Per-host politeness: caps concurrent requests and spaces them out"""
+
+    def __init__(self, per_host_limit, request_delay):
+        self.per_host_limit = max(1, per_host_limit)
+        self.request_delay = request_delay
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._last_request = {}
+
+    def _semaphore(self, host):
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.Semaphore(self.per_host_limit)
+            return self._semaphores[host]
+
+    def _wait_turn(self, host):
+        # Reserve the next slot for this host, then sleep outside the lock
+        with self._lock:
+            now = time.monotonic()
+            next_slot = max(now, self._last_request.get(host, now - self.request_delay) + self.request_delay)
+            self._last_request[host] = next_slot
+        if next_slot > now:
+            time.sleep(next_slot - now)
+
+    def run(self, host, func, *args, **kwargs):
+        """Call func while holding this host's slot"""
+        with self._semaphore(host):
+            self._wait_turn(host)
+            return func(*args, **kwargs)
+
 # ==================== NEWS AGGREGATOR CLASS ====================
 
 class NewsAggregator:
-    def __init__(self):
+    def __init__(self, max_workers=None, per_host_limit=None, request_delay=None, config_loader=None):
         self.articles = []
-        self.stats = {
+        self.config_loader = config_loader or ConfigLoader(DEFAULT_CONFIG)
+        self.config = self.config_loader.get()
+        self.max_workers = max_workers or FETCH_CONFIG["max_workers"]
+        self.host_limiter = HostLimiter(
+            per_host_limit or FETCH_CONFIG["per_host_limit"],
+            FETCH_CONFIG["request_delay"] if request_delay is None else request_delay,
+        )
+        self.fetcher = FeedFetcher(
+            FETCH_CONFIG["connect_timeout"],
+            FETCH_CONFIG["read_timeout"],
+            FETCH_CONFIG["total_timeout"],
+            FETCH_CONFIG["max_feed_bytes"],
+            pool_size=self.max_workers,
+        )
+        self.feed_cache = FeedCache(FEED_CACHE_PATH, self.config.rules_version)
+        self.seen_index = SeenIndex(SEEN_INDEX_PATH, self.config.rules_version)
+        self.feed_health = FeedHealth(FEED_HEALTH_PATH, **HEALTH_CONFIG)
+        self.search_index = SearchIndex(SEARCH_INDEX_PATH)
+        self.metrics = Metrics()
+        self.stats = self.new_stats()
+        self.start_run()
+    
+    def new_stats(self):
+        """Fresh per-run counters"""
+        return {
             "total_fetched": 0,
             "rejected_by_rules": 0,
             "rejected_by_score": 0,
-            "accepted_by_tier": {tier: 0 for tier in RSS_FEEDS_BY_TIER.keys()}
+            "accepted_by_tier": {tier: 0 for tier in self.config.feeds_by_tier.keys()},
+            "feed_cache": {"hits": 0, "misses": 0, "by_feed": {}},
+            "near_duplicates_removed": 0,
+            "output_bytes": {},
+            "seen_index": {"hits": 0, "misses": 0},
         }
+    
+    def start_run(self):
+        """Fix the clock and pick up config changes once per run"""
+        self.run_started = datetime.now()
+        self.window_start = self.run_started - MAX_ARTICLE_AGE
+        
+        config = self.config_loader.get()
+        if config is not self.config:
+            if config.rules_version != self.config.rules_version:
+                # Cached results were scored with the old rules
+                self.feed_cache = FeedCache(FEED_CACHE_PATH, config.rules_version)
+                self.seen_index.close()
+                self.seen_index = SeenIndex(SEEN_INDEX_PATH, config.rules_version)
+            for tier in config.feeds_by_tier:
+                self.stats["accepted_by_tier"].setdefault(tier, 0)
+            self.config = config
         
     def get_domain_name(self, url):
         """Extract domain name from URL"""
-        return urlparse(url).netloc
+        return get_domain(url)
     
     def get_proper_source_name(self, feed_url, entry):
         """Get proper source name from domain mapping"""
-        domain = self.get_domain_name(feed_url)
-        
-        for key, name in SOURCE_NAME_MAP.items():
-            if key in domain:
-                return name
-        
-        # Default: clean up domain name
-        clean_name = domain.replace('www.', '').split('.')[0]
-        return clean_name.title()
+        return self.config.registry.source_name(feed_url)
     
     def get_published_time(self, entry):
         """Extract publication time from RSS entry"""
@@ -212,6 +399,11 @@ class NewsAggregator:
             return datetime(*entry.updated_parsed[:6])
         return None
     
+    def get_entry_key(self, entry):
+        """Stable key of a feed entry for the seen-article index"""
+        identity = entry.get('id') or entry.get('link') or entry.get('title', '')
+        return hashlib.md5(identity.encode()).hexdigest()
+    
     def get_clean_description(self, entry):
         """Extract and clean description"""
         description = ""
@@ -221,211 +413,300 @@ class NewsAggregator:
         elif hasattr(entry, 'summary'):
             description = entry.summary
 
-        # Decode HTML entities (e.g. &#8230;) and remove HTML tags
-        clean_desc = html.unescape(description)
-        clean_desc = re.sub('<[^<]+?>', '', clean_desc)
-
-        # Remove publisher-added truncation markers
-        clean_desc = re.sub(r'\[\s*…\s*\]|\[\s*\.\.\.\s*\]', '', clean_desc).strip()
-
-        # Limit length for safety
-        if len(clean_desc) > 200:
-            if '.' in clean_desc[:150]:
-                sentences = clean_desc.split('.')
-                if len(sentences[0]) < 150:
-                    clean_desc = sentences[0] + '.'
-                else:
-                    clean_desc = clean_desc[:147] + '...'
-            else:
-                clean_desc = clean_desc[:197] + '...'
-
-        return clean_desc.strip()
+        # Decode HTML entities (e.g. &#8230;), remove HTML tags and
+        # publisher truncation markers, then limit length for safety
+        return clean_description(description, FETCH_CONFIG["lxml_min_tags"])
       
     def should_reject_article(self, title, description):
         """Check if article should be immediately rejected"""
-        content = f"{title} {description}".lower()
-        
-        for rule_type, keywords, *extra in REJECTION_RULES:
-            if rule_type == "any":
-                # Reject if ANY of these keywords appear
-                if any(keyword.lower() in content for keyword in keywords):
-                    return True, f"Rejected by {keywords[0]} rule"
-            
-            elif rule_type == "context" and extra:
-                # Check contextual rejection
-                main_words, forbidden_words = keywords, extra[0]
-                has_main = any(word.lower() in content for word in main_words)
-                has_forbidden = any(word.lower() in content for word in forbidden_words)
-                
-                if has_main and has_forbidden:
-                    return True, f"Rejected by contextual rule: {main_words[0]} + {forbidden_words[0]}"
-        
-        return False, ""
+        analysis = self.config.analyzer.analyze(title, description, None)
+        return analysis['rejected'], analysis['reason']
     
     def calculate_relevance_score(self, title, description, source_tier):
         """Calculate enhanced relevance score with contextual analysis"""
-        content = f"{title} {description}".lower()
-        score = 0
+        return self.config.analyzer.analyze(title, description, source_tier)['score']
+    
+    def get_source_tier(self, feed_url):
+        """Determine which tier a feed belongs to"""
+        return self.config.registry.tier(feed_url)
+    
+    def download_feed(self, feed_url, conditional=True, windowed=True):
+        """Download and parse a single feed, respecting the per-host limits
         
-        # ===== POSITIVE SCORING =====
+        With `windowed`, the fast parser stops at what scoring reads (see
+        window_entries); otherwise every entry is parsed.
+        """
+        tier_name = self.get_source_tier(feed_url)
+        etag, modified = self.feed_cache.validators(feed_url, tier_name) if conditional else (None, None)
         
-        # 1. Strong phrase matches (environmental action)
-        for phrase in KEYWORD_CATEGORIES["environmental_action"]:
-            if phrase.lower() in content:
-                score += 4  # Strong bonus for specific phrases
+        def timed_fetch():
+            # Timed inside the host slot so politeness waits are not counted
+            with self.metrics.timer("feed_download_seconds", feed=feed_url):
+                return self.fetcher.fetch(feed_url, etag, modified)
         
-        # 2. ESG reporting phrases
-        for phrase in KEYWORD_CATEGORIES["esg_reporting"]:
-            if phrase.lower() in content:
-                score += 4
+        response = self.host_limiter.run(self.get_domain_name(feed_url), timed_fetch)
+        self.metrics.count("feed_bytes_total", len(response.body), feed=feed_url)
+        self.metrics.count("feed_wire_bytes_total", response.wire_bytes, feed=feed_url)
         
-        # 3. Fashion sustainability phrases
-        for phrase in KEYWORD_CATEGORIES["fashion_sustainability"]:
-            if phrase.lower() in content:
-                score += 3
+        if response.status == 304:
+            feed = feedparser.FeedParserDict(bozo=False, entries=[], feed=feedparser.FeedParserDict())
+        else:
+            # Parsing happens outside the host slot; feedparser never touches the network.
+            # Content-Location gives it the base URL for resolving relative links.
+            headers = dict(response.headers)
+            if headers:
+                headers.setdefault('content-location', response.url)
+            with self.metrics.timer("feed_parse_seconds", feed=feed_url):
+                feed = None
+                if FETCH_CONFIG["fast_parser"]:
+                    select = None
+                    if windowed:
+                        # Parse only as far as scoring will read
+                        max_articles = self.config.tier_config[tier_name]["max_articles"]
+                        select = lambda entries: self.window_entries(entries, max_articles)
+                    feed = parse_feed(response.body, response.url, select=select)
+                    self.metrics.count("feed_parser_total", parser="lxml" if feed is not None else "feedparser")
+                if feed is None:
+                    feed = feedparser.parse(response.body, response_headers=headers)
         
-        # 4. General keywords (weaker matches)
-        for keyword in KEYWORD_CATEGORIES["general_keywords"]:
-            if keyword.lower() in content:
-                score += 1
+        feed['status'] = response.status
+        feed['href'] = response.url
+        feed['headers'] = response.headers
+        feed['etag'] = response.headers.get('etag')
+        feed['modified'] = response.headers.get('last-modified')
+        return feed
+    
+    def download_feeds(self, feed_urls, conditional=True, windowed=True):
+        """Download feeds concurrently, returning {feed_url: (feed, error)}"""
+        results = {}
         
-        # 5. Check for multiple sustainability indicators
-        sustainability_indicators = 0
-        all_keywords = []
-        for category in KEYWORD_CATEGORIES.values():
-            all_keywords.extend(category)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {url: executor.submit(self.download_feed, url, conditional, windowed) for url in feed_urls}
+            for url, future in futures.items():
+                try:
+                    results[url] = (future.result(), None)
+                except Exception as e:
+                    results[url] = (None, e)
         
-        for keyword in all_keywords:
-            if keyword.lower() in content:
-                sustainability_indicators += 1
+        return results
+    
+    def record_download(self, feed_url, feed, error):
+        """Record a download in the health store, returning its problem or None"""
+        if error is not None:
+            problem = str(error) or type(error).__name__
+        elif feed.bozo:
+            problem = f"Feed error: {feed.get('bozo_exception', 'parse error')}"
+        else:
+            self.feed_health.record_success(feed_url)
+            return None
         
-        if sustainability_indicators >= 3:
-            score += 3  # Bonus for multiple sustainability mentions
-        elif sustainability_indicators >= 2:
-            score += 2
+        self.feed_health.record_failure(feed_url, problem)
+        self.metrics.count("feed_errors_total", feed=feed_url)
+        return problem
+    
+    def window_entries(self, entries, max_articles):
+        """Yield in-window entries in order until max_articles of them or a run of stale ones
         
-        # ===== NEGATIVE SCORING =====
+        Articles older than 7 days are dropped without using up the feed's
+        budget. Feeds list newest first, so a run of old dates means the rest
+        of the feed is old too and is not read at all.
+        """
+        taken = stale = 0
+        for entry in entries:
+            published_time = self.get_published_time(entry)
+            if published_time and published_time < self.window_start:
+                stale += 1
+                if stale >= FETCH_CONFIG["stale_run"]:
+                    return
+                continue
+            
+            stale = 0
+            yield entry
+            taken += 1
+            if taken >= max_articles:
+                return
+    
+    def score_feed_entries(self, feed, feed_url, tier_name):
+        """Filter and score feed entries, returning candidates scored without the recency bonus"""
+        tier_config = self.config.tier_config[tier_name]
+        candidates = []
         
-        # Strong penalty for negative keywords
-        for phrase in NEGATIVE_KEYWORDS:
-            if phrase.lower() in content:
-                score -= 5
+        index_stats = self.stats["seen_index"]
         
-        # ===== CONTEXTUAL CHECKS =====
+        for entry in self.window_entries(feed.entries, tier_config["max_articles"]):
+            published_time = self.get_published_time(entry)
+            
+            # Entries processed by an earlier run are reused as they were
+            key = self.get_entry_key(entry)
+            seen, candidate = self.seen_index.lookup(key, tier_name)
+            if seen:
+                index_stats["hits"] += 1
+                if candidate is None:
+                    self.stats["rejected_by_rules"] += 1
+                    self.metrics.count("articles_rejected_total", reason="rules")
+                else:
+                    candidates.append(candidate)
+                continue
+            index_stats["misses"] += 1
+            
+            title = entry.title if hasattr(entry, 'title') else "No title"
+            description = self.get_clean_description(entry)
+            
+            # 1. Check for immediate rejection and 2. score, in a single pass
+            analysis = self.config.analyzer.analyze(title, description, tier_name)
+            if analysis['rejected']:
+                self.stats["rejected_by_rules"] += 1
+                self.metrics.count("articles_rejected_total", reason="rules")
+                self.seen_index.record(key, feed_url, None)
+                continue
+            
+            relevance_score = analysis['score']
+            
+            candidate = {
+                'article': {
+                    'title': title,
+                    'description': description,
+                    'url': entry.link if hasattr(entry, 'link') else '',
+                    'publishedAt': published_time.isoformat() if published_time else self.run_started.isoformat(),
+                    'source': self.get_proper_source_name(feed_url, entry),
+                    'relevance_score': relevance_score,
+                    'source_tier': tier_name,
+                    'api_source': 'rss',
+                },
+                'published': published_time.isoformat() if published_time else None,
+            }
+            self.seen_index.record(key, feed_url, candidate)
+            candidates.append(candidate)
         
-        # Check if sustainability terms are in the TITLE (stronger indicator)
-        title_lower = title.lower()
-        title_sustainability_terms = 0
-        for category in KEYWORD_CATEGORIES.values():
-            for keyword in category:
-                if keyword.lower() in title_lower:
-                    title_sustainability_terms += 1
-                    score += 2  # Extra bonus for title mention
+        return candidates
+    
+    def accept_candidates(self, candidates, tier_name):
+        """Apply the recency bonus and tier threshold, returning accepted count"""
+        tier_config = self.config.tier_config[tier_name]
+        articles_from_feed = 0
         
-        # ===== TIER BONUS =====
+        for candidate in candidates:
+            published_time = datetime.fromisoformat(candidate['published']) if candidate['published'] else None
+            relevance_score = candidate['article']['relevance_score']
+            
+            # Cached candidates may have aged out of the 7-day window since
+            if published_time and published_time < self.window_start:
+                continue
+            
+            # 3. Add recency bonus if article is relevant
+            if relevance_score > 0 and published_time:
+                days_old = (self.run_started - published_time).days
+                if days_old == 0:
+                    relevance_score += 2  # Today's news
+                elif days_old <= 2:
+                    relevance_score += 1  # Last 2 days
+            
+            # 4. Apply tier-specific threshold
+            if relevance_score >= tier_config["threshold"]:
+                article = Article.from_dict(candidate['article'])
+                article.relevance_score = relevance_score
+                
+                self.articles.append(article)
+                articles_from_feed += 1
+                self.stats["total_fetched"] += 1
+                self.metrics.count("articles_accepted_total", tier=tier_name)
+            else:
+                self.stats["rejected_by_score"] += 1
+                self.metrics.count("articles_rejected_total", reason="score")
         
-        # Add tier-specific bonus
-        tier_config = TIER_CONFIG.get(source_tier, {})
-        score += tier_config.get("bonus_score", 0)
+        return articles_from_feed
+    
+    def get_feed_candidates(self, feed, feed_url, tier_name):
+        """Candidates of a downloaded feed: replayed from the cache on 304, otherwise scored"""
+        cache_stats = self.stats["feed_cache"]
         
-        # ===== RECENCY BONUS =====
-        # (Applied later when we have publish date)
+        # 304 Not Modified: replay what this feed produced last time
+        if getattr(feed, 'status', None) == 304:
+            cache_stats["hits"] += 1
+            cache_stats["by_feed"][feed_url] = "hit"
+            self.metrics.count("feed_cache_total", result="hit")
+            return self.feed_cache.candidates(feed_url)
         
-        return max(0, score)
-    
-    def get_source_tier(self, feed_url):
-        """Determine which tier a feed belongs to"""
-        for tier, feeds in RSS_FEEDS_BY_TIER.items():
-            if feed_url in feeds:
-                return tier
+        cache_stats["misses"] += 1
+        cache_stats["by_feed"][feed_url] = "miss"
+        self.metrics.count("feed_cache_total", result="miss")
+        self.metrics.count("feed_entries_total", len(feed.entries), feed=feed_url)
         
-        # Default to general news if not found
-        return "tier4_general_news"
+        with self.metrics.timer("feed_score_seconds", feed=feed_url):
+            candidates = self.score_feed_entries(feed, feed_url, tier_name)
+        self.feed_cache.store(feed_url, feed, candidates, tier_name)
+        return candidates
+    
+    def process_feed(self, feed, feed_url, tier_name):
+        """Filter and score the entries of a downloaded feed, returning accepted count"""
+        return self.accept_candidates(self.get_feed_candidates(feed, feed_url, tier_name), tier_name)
+    
+    def rebuild_articles(self, feed_candidates):
+        """Rebuild the article list from per-feed candidates, in tier order"""
+        self.articles = []
+        for tier_name, feed_list in self.config.feeds_by_tier.items():
+            articles_from_tier = 0
+            for feed_url in feed_list:
+                if feed_url in feed_candidates:
+                    articles_from_tier += self.accept_candidates(feed_candidates[feed_url], tier_name)
+            self.stats["accepted_by_tier"][tier_name] = articles_from_tier
+        print(f"📥 {len(self.articles)} articles accepted from {len(feed_candidates)} feeds")
     
+    @timed("stage_seconds", stage="fetch")
     def fetch_rss_feeds(self):
         """Fetch news from RSS feeds with tier-based filtering"""
         print("📡 Fetching from RSS feeds...\n")
+        self.start_run()
         
-        for tier_name, feed_list in RSS_FEEDS_BY_TIER.items():
+        # Downloads run concurrently; results are processed in tier order below
+        # so stats and article ordering stay deterministic. Feeds whose circuit
+        # is open are skipped without a request.
+        feed_urls = self.config.feed_urls()
+        self.feed_health.forget(feed_urls)
+        downloads = self.download_feeds([url for url in feed_urls if self.feed_health.allow(url)])
+        
+        for tier_name, feed_list in self.config.feeds_by_tier.items():
             print(f"🔹 Processing {tier_name.replace('_', ' ').title()} feeds...")
             
-            tier_config = TIER_CONFIG[tier_name]
             articles_from_tier = 0
             
             for feed_url in feed_list:
                 try:
                     print(f"  Fetching: {self.get_domain_name(feed_url)}", end="")
                     
-                    # Add delay to be respectful to servers
-                    time.sleep(0.5)
-                    
-                    feed = feedparser.parse(feed_url)
-                    
-                    if feed.bozo:
-                        print(" ❌ (Feed error)")
+                    if feed_url not in downloads:
+                        print(" ⏸️  (skipped: failing feed)")
+                        self.metrics.count("feed_skipped_total", feed=feed_url)
                         continue
                     
-                    articles_from_feed = 0
-                    max_articles = min(tier_config["max_articles"], len(feed.entries))
+                    feed, error = downloads[feed_url]
+                    problem = self.record_download(feed_url, feed, error)
+                    if problem is not None:
+                        print(f" ❌ {problem[:50]}")
+                        continue
                     
-                    for entry in feed.entries[:max_articles]:
-                        # Skip old articles (older than 7 days)
-                        published_time = self.get_published_time(entry)
-                        if published_time and published_time < (datetime.now() - timedelta(days=7)):
-                            continue
-                        
-                        title = entry.title if hasattr(entry, 'title') else "No title"
-                        description = self.get_clean_description(entry)
-                        
-                        # 1. Check for immediate rejection
-                        should_reject, reason = self.should_reject_article(title, description)
-                        if should_reject:
-                            self.stats["rejected_by_rules"] += 1
-                            continue
-                        
-                        # 2. Calculate relevance score
-                        relevance_score = self.calculate_relevance_score(
-                            title, description, tier_name
-                        )
-                        
-                        # 3. Add recency bonus if article is relevant
-                        if relevance_score > 0 and published_time:
-                            days_old = (datetime.now() - published_time).days
-                            if days_old == 0:
-                                relevance_score += 2  # Today's news
-                            elif days_old <= 2:
-                                relevance_score += 1  # Last 2 days
-                        
-                        # 4. Apply tier-specific threshold
-                        if relevance_score >= tier_config["threshold"]:
-                            article = {
-                                'title': title,
-                                'description': description,
-                                'url': entry.link if hasattr(entry, 'link') else '',
-                                'publishedAt': published_time.isoformat() if published_time else datetime.now().isoformat(),
-                                'source': self.get_proper_source_name(feed_url, entry),
-                                'content': description[:200],
-                                'relevance_score': relevance_score,
-                                'source_tier': tier_name,
-                                'api_source': 'rss',
-                            }
-                            
-                            self.articles.append(article)
-                            articles_from_feed += 1
-                            articles_from_tier += 1
-                            self.stats["total_fetched"] += 1
-                        else:
-                            self.stats["rejected_by_score"] += 1
+                    articles_from_feed = self.process_feed(feed, feed_url, tier_name)
+                    articles_from_tier += articles_from_feed
                     
                     print(f" ✅ ({articles_from_feed} articles)")
                     
                 except Exception as e:
                     print(f" ❌ Error: {str(e)[:50]}...")
+                    self.metrics.count("feed_errors_total", feed=feed_url)
                     continue
             
             self.stats["accepted_by_tier"][tier_name] = articles_from_tier
             print(f"  Total from this tier: {articles_from_tier} articles\n")
+        
+        cache_stats = self.stats["feed_cache"]
+        print(f"🗄️  Feed cache: {cache_stats['hits']} unchanged (304), {cache_stats['misses']} downloaded")
+        index_stats = self.stats["seen_index"]
+        print(f"🗄️  Seen index: {index_stats['hits']} entries reused, {index_stats['misses']} processed\n")
+        self.feed_cache.save()
+        self.seen_index.save()
+        self.feed_health.save()
     
+    @timed("stage_seconds", stage="dedupe")
     def deduplicate_articles(self):
         """Remove duplicate articles based on URL and title similarity"""
         print("🔄 Deduplicating articles...")
@@ -435,8 +716,8 @@ class NewsAggregator:
         unique_articles = []
         
         for article in self.articles:
-            url = article.get('url', '')
-            title = article.get('title', '').lower().strip()
+            url = article.url or ''
+            title = (article.title or '').lower().strip()
             
             # Normalize URL
             url_normalized = url.split('?')[0].split('#')[0]
@@ -453,13 +734,46 @@ class NewsAggregator:
         removed = len(self.articles) - len(unique_articles)
         print(f"✅ Removed {removed} duplicates")
         self.articles = unique_articles
+        
+        self.merge_near_duplicates()
     
+    def merge_near_duplicates(self):
+        """Collapse near-duplicate stories, keeping the highest scoring one"""
+        texts = [f"{article.title} {article.description}" for article in self.articles]
+        clusters = find_clusters(
+            texts,
+            threshold=DEDUPE_CONFIG["similarity_threshold"],
+            shingle_size=DEDUPE_CONFIG["shingle_size"],
+            num_perm=DEDUPE_CONFIG["num_perm"],
+            bands=DEDUPE_CONFIG["bands"],
+        )
+        
+        dropped = set()
+        for members in clusters:
+            # max() keeps the earliest article on score ties
+            keep = max(members, key=lambda index: self.articles[index].relevance_score)
+            self.articles[keep].near_duplicates = [
+                {
+                    'title': self.articles[index].title,
+                    'url': self.articles[index].url,
+                    'source': self.articles[index].source,
+                }
+                for index in members if index != keep
+            ]
+            dropped.update(index for index in members if index != keep)
+        
+        self.articles = [article for index, article in enumerate(self.articles) if index not in dropped]
+        self.stats["near_duplicates_removed"] = len(dropped)
+        self.metrics.count("near_duplicates_removed_total", len(dropped))
+        print(f"✅ Merged {len(dropped)} near-duplicates in {len(clusters)} clusters")
+    
+    @timed("stage_seconds", stage="process")
     def process_articles(self):
         """Process and analyze articles"""
         print("\n🔧 Processing articles...")
         
         # Sort by relevance score and date
-        self.articles.sort(key=lambda x: (x['relevance_score'], x['publishedAt']), reverse=True)
+        self.articles.sort(key=lambda x: (x.relevance_score, x.published_at), reverse=True)
         
         # Show statistics
         print(f"📊 Total articles after filtering: {len(self.articles)}")
@@ -474,7 +788,7 @@ class NewsAggregator:
         # Show score distribution
         score_counts = {}
         for article in self.articles:
-            score = article['relevance_score']
+            score = article.relevance_score
             score_counts[score] = score_counts.get(score, 0) + 1
         
         print("\n📊 Score distribution:")
@@ -482,107 +796,258 @@ class NewsAggregator:
             print(f"   Score {score}: {count} articles")
         
         # Show top articles
-        top_articles = [a for a in self.articles if a['relevance_score'] >= 8][:5]
+        top_articles = [a for a in self.articles if a.relevance_score >= 8][:5]
         if top_articles:
             print("\n🏆 Top relevant articles:")
             for i, article in enumerate(top_articles, 1):
-                print(f"   {i}. {article['title'][:80]}...")
-                print(f"      Score: {article['relevance_score']} | Source: {article['source']} | Tier: {article['source_tier']}")
+                print(f"   {i}. {article.title[:80]}...")
+                print(f"      Score: {article.relevance_score} | Source: {article.source} | Tier: {article.source_tier}")
         
         # Show potential false positives (high scores from general news)
         general_high_scores = [
             a for a in self.articles 
-            if a['source_tier'] == 'tier4_general_news' and a['relevance_score'] >= 8
+            if a.source_tier == 'tier4_general_news' and a.relevance_score >= 8
         ]
         
         if general_high_scores:
             print(f"\n⚠️  Note: {len(general_high_scores)} high-scoring articles from general news sources")
             print("   Review these for potential false positives.")
     
+    @timed("stage_seconds", stage="save")
     def save_articles(self):
         """Save articles to JSON files - compatible with current frontend"""
         print("\n💾 Saving articles...")
         
-        # Format compatible with your current frontend
+        # Nothing to publish when the article set is the one already published
+        shard_dir = OUTPUT_CONFIG["shard_dir"]
+        published = read_manifest(shard_dir)
+        publish_hash = content_hash({
+            'page_size': OUTPUT_CONFIG["shard_size"],
+            'precompress': sorted(available(OUTPUT_CONFIG["precompress"])),
+            'articles': [frontend_article(article) for article in self.articles],
+        })
+        if published and published.get('content_hash') == publish_hash:
+            print(f"✅ Articles unchanged since the last publish ({publish_hash[:12]}), nothing written")
+            return
+        
+        # Search index first, so the manifest never points at a missing file
+        os.makedirs(shard_dir, exist_ok=True)
+        doc_ids = [article_id(article) for article in self.articles]
+        added, removed, reused = self.search_index.update({
+            doc_id: f"{article.title} {article.description}" for doc_id, article in zip(doc_ids, self.articles)
+        })
+        search_index_file = write_addressed(shard_dir, OUTPUT_CONFIG["search_index"], self.search_index.export(doc_ids))
+        self.search_index.save()
+        
+        # Delta against the previously published set, so returning clients skip the shards
+        version, chain, delta = self.publish_delta(shard_dir)
+        
+        # Content-addressed page shards; the frontend paints page one from a single shard.
+        # The manifest pointing at them is written last, once everything else is in place:
+        # its content_hash is what lets the next run skip an unchanged publish.
+        manifest = write_shards(
+            self.articles, shard_dir, OUTPUT_CONFIG["shard_size"],
+            extra={
+                'content_hash': publish_hash,
+                'search_index': search_index_file,
+                'version': version,
+                'deltas': chain,
+            },
+        )
+        manifest_path = os.path.join(shard_dir, 'manifest.json')
+        
+        # Legacy single file, kept for existing clients
         frontend_data = {
             'status': 'ok',
             'totalResults': len(self.articles),
-            'articles': [
-                {
-                    'source': {'name': article['source']},
-                    'author': article['source'],
-                    'title': article['title'],
-                    'description': article['description'],
-                    'url': article['url'],
-                    'publishedAt': article['publishedAt'],
-                    'content': article['content'][:200] if article['content'] else article['description'][:200]
-                }
-                for article in self.articles[:100]  # Limit to 100 for frontend
-            ]
+            'articles': [frontend_article(article) for article in self.articles[:OUTPUT_CONFIG["legacy_limit"]]]
         }
         
         # Save to news.json
         with open('news.json', 'w', encoding='utf-8') as f:
             json.dump(frontend_data, f, indent=2, ensure_ascii=False)
         
+        # Pre-compressed siblings of everything published, with their sizes in the stats;
+        # the manifest's come from its content, as the file itself is not written yet
+        published_files = [manifest['search_index']]
+        published_files += [name for order in manifest['orders'].values() for name in order['files']]
+        if delta is not None:
+            published_files.append(chain[-1]['file'])
+        self.stats["output_bytes"] = self.precompress_outputs(
+            ['news.json'] + [os.path.join(shard_dir, name) for name in published_files],
+            {manifest_path: serialize(manifest).encode('utf-8')},
+        )
+        
         # Also save detailed version for debugging
         detailed_data = {
             'metadata': {
                 'generated_at': datetime.now().isoformat(),
                 'total_articles': len(self.articles),
-                'stats': self.stats
+                'stats': self.stats,
+                'metrics': self.metrics.as_dict(),
             },
-            'articles': self.articles
+            'articles': [article.to_dict() for article in self.articles]
         }
         
         with open('news_detailed.json', 'w', encoding='utf-8') as f:
             json.dump(detailed_data, f, indent=2, ensure_ascii=False)
+        precompress('news_detailed.json', available(OUTPUT_CONFIG["precompress"]))
         
-        print(f"✅ Saved {len(self.articles)} articles to news.json")
+        publish_manifest(shard_dir, manifest, previous=published)
+        
+        shard_count = sum(order['pages'] for order in manifest['orders'].values())
+        print(f"✅ Saved {len(self.articles)} articles to {OUTPUT_CONFIG['shard_dir']}/ ({shard_count} shards)")
+        print(f"✅ Saved {len(frontend_data['articles'])} articles to news.json")
+        print(f"✅ Search index: {added} articles indexed, {reused} reused, {removed} removed")
+        if delta is None:
+            print(f"✅ Published version {version}")
+        else:
+            print(
+                f"✅ Published version {version}: {len(delta['added'])} added, {len(delta['updated'])} updated, "
+                f"{len(delta['removed'])} removed, {len(delta['rescored'])} re-scored"
+            )
         print("✅ Saved detailed data to news_detailed.json for debugging")
+        
+        sizes = self.stats["output_bytes"]
+        encodings = [encoding for encoding in sizes if encoding not in ("files", "raw")]
+        if encodings:
+            compressed = ", ".join(f"{sizes[encoding] / 1024:.1f} KiB {encoding}" for encoding in encodings)
+            print(f"✅ Pre-compressed {sizes['files']} outputs: {sizes['raw'] / 1024:.1f} KiB raw, {compressed}")
+        
+        if ARCHIVE_APPEND_PATH:
+            archived = append_articles(ARCHIVE_APPEND_PATH, (article.to_dict() for article in self.articles))
+            print(f"✅ Appended {archived} articles to {ARCHIVE_APPEND_PATH}")
+    
+    def precompress_outputs(self, paths, pending=None):
+        """Write the configured .gz/.br siblings of output files, returning total sizes per encoding
+        
+        `pending` maps paths not written yet to their content.
+        """
+        encodings = available(OUTPUT_CONFIG["precompress"])
+        if len(encodings) < len(OUTPUT_CONFIG["precompress"]):
+            print("⚠️  brotli is not installed; skipping .br outputs")
+        
+        pending = pending or {}
+        totals = {"files": len(paths) + len(pending), "raw": 0, **{encoding: 0 for encoding in encodings}}
+        for path, data in [(path, None) for path in paths] + list(pending.items()):
+            for encoding, size in precompress(path, encodings, data).items():
+                totals[encoding] += size
+                self.metrics.count("output_bytes_total", size, encoding=encoding)
+        return totals
+    
+    def publish_delta(self, shard_dir):
+        """Diff against the published output, returning (version, delta chain, delta or None)
+        
+        The version only moves when the published set changes. Without a
+        previous versioned manifest the chain starts over. Version numbers are
+        never reused (see next_version), since clients keep the articles of
+        the version they last loaded.
+        """
+        previous_manifest, previous = load_published(shard_dir)
+        if previous_manifest is None or 'version' not in previous_manifest:
+            return next_version(), [], None
+        
+        version = previous_manifest['version']
+        if previous is None:
+            # Nothing to diff against: a new version with an empty chain makes
+            # every returning client reload in full
+            return next_version(version), [], None
+        
+        chain = previous_manifest.get('deltas', [])
+        if chain and chain[-1]['to'] != version:
+            chain = []
+        
+        current = {row['id']: row for row in map(frontend_article, self.articles)}
+        delta = diff_articles(previous, current)
+        if is_empty(delta):
+            return version, chain, None
+        
+        version, chain = write_delta(shard_dir, version, delta, len(current), chain, OUTPUT_CONFIG["delta_chain"])
+        return version, chain, delta
+    
+    def save_metrics(self, path):
+        """Write run metrics in Prometheus text format"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.metrics.to_prometheus())
+        print(f"✅ Saved metrics to {path}")
     
     def run_health_check(self):
-        """Quick health check of RSS feeds"""
+        """Probe every configured feed and report the health store"""
         print("🏥 Running RSS feed health check...\n")
         
-        healthy_feeds = []
-        problematic_feeds = []
+        # Unconditional downloads, ignoring open circuits: this is the probe.
+        # Entries are counted whatever their age; a feed with only old items
+        # is alive, just quiet.
+        feed_urls = self.config.feed_urls()
+        self.feed_health.forget(feed_urls)
+        downloads = self.download_feeds(feed_urls, conditional=False, windowed=False)
         
-        for tier_name, feed_list in RSS_FEEDS_BY_TIER.items():
-            for feed_url in feed_list[:3]:  # Check first 3 from each tier
-                try:
-                    feed = feedparser.parse(feed_url)
-                    if feed.bozo:
-                        problematic_feeds.append((feed_url, "Parse error"))
-                    elif len(feed.entries) == 0:
-                        problematic_feeds.append((feed_url, "No entries"))
-                    else:
-                        healthy_feeds.append(feed_url)
-                except Exception as e:
-                    problematic_feeds.append((feed_url, str(e)))
+        healthy_feeds = 0
+        for feed_url in feed_urls:
+            feed, error = downloads[feed_url]
+            if self.record_download(feed_url, feed, error) is None:
+                if len(feed.entries) == 0:
+                    self.feed_health.record_failure(feed_url, "No entries")
+                else:
+                    healthy_feeds += 1
+        self.feed_health.save()
         
-        print(f"✅ Healthy feeds: {len(healthy_feeds)}")
-        print(f"⚠️  Problematic feeds: {len(problematic_feeds)}")
+        problems = self.feed_health.problems()
+        print(f"✅ Healthy feeds: {healthy_feeds}")
+        print(f"⚠️  Problematic feeds: {len(problems)}")
         
-        if problematic_feeds:
+        if problems:
             print("\nProblematic feeds to investigate:")
-            for url, issue in problematic_feeds[:5]:  # Show first 5
+            for url, record in problems:
+                if record['open_until']:
+                    until = datetime.fromtimestamp(record['open_until']).strftime('%Y-%m-%d %H:%M')
+                    status = f"skipped until {until}"
+                else:
+                    status = "still polled"
                 print(f"  - {url}")
-                print(f"    Issue: {issue}")
+                print(f"    Issue: {record['last_error']} ({record['failures']} consecutive failures, {status})")
 
 # ==================== MAIN EXECUTION ====================
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="SustainNews RSS aggregator")
+    parser.add_argument(
+        '--config', default=os.environ.get('SUSTAIN_NEWS_CONFIG'),
+        help="JSON/YAML/TOML file overriding the built-in feeds, tiers and keyword rules",
+    )
+    parser.add_argument('--dump-config', metavar='PATH', help="write the built-in configuration as JSON and exit")
+    parser.add_argument(
+        '--daemon', action='store_true',
+        help="keep running, polling each feed on its own interval and saving only when articles change",
+    )
+    parser.add_argument(
+        '--health-check', action='store_true',
+        help="probe every feed, update the feed health store and report failing feeds",
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    
+    if args.dump_config:
+        dump_config(DEFAULT_CONFIG, args.dump_config)
+        print(f"✅ Wrote built-in configuration to {args.dump_config}")
+        return
+    
     print("🚀 Starting SustainNews Aggregator (Enhanced Version)")
     print("=" * 50)
     print(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print("=" * 50)
     
-    aggregator = NewsAggregator()
+    aggregator = NewsAggregator(config_loader=ConfigLoader(DEFAULT_CONFIG, args.config))
+    
+    if args.daemon:
+        run_daemon(aggregator, **DAEMON_CONFIG)
+        return
     
-    # Optional: Run health check first
-    # aggregator.run_health_check()
-    # print("\n" + "=" * 50 + "\n")
+    if args.health_check:
+        aggregator.run_health_check()
+        return
     
     # Fetch from RSS feeds with tier-based filtering
     aggregator.fetch_rss_feeds()
@@ -596,6 +1061,8 @@ def main():
     
     # Save results
     aggregator.save_articles()
+    if METRICS_PROMETHEUS_PATH:
+        aggregator.save_metrics(METRICS_PROMETHEUS_PATH)
     
     print("\n" + "=" * 50)
     print("🎉 SustainNews aggregation completed successfully!")
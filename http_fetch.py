@@ -0,0 +1,120 @@
+import os
+import socket
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING  # includes "br" when brotli is installed
+
+USER_AGENT = 'SustainNews/1.0 (+https://github.com/sustainthread/sustain-news)'
+CHUNK_SIZE = 64 * 1024
+
+
+class FetchResult:
+    """Raw outcome of a feed download"""
+
+    __slots__ = ('url', 'status', 'headers', 'body', 'wire_bytes')
+
+    def __init__(self, url, status, headers, body, wire_bytes):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.wire_bytes = wire_bytes
+
+
+class FeedFetcher:
+    """Pooled HTTP client for feed downloads
+
+    One requests.Session is shared by all download threads, so feeds on the
+    same host reuse keep-alive connections. Every request has connect/read
+    timeouts plus a total deadline, and bodies are capped at max_bytes after
+    decompression, so a slow or oversized feed fails instead of stalling the
+    run. The deadline is enforced by shutting the socket down from a timer,
+    which also interrupts a read blocked on a server dripping bytes. Paths
+    and file:// URLs are read from disk (used by local fixtures).
+    """
+
+    def __init__(self, connect_timeout, read_timeout, total_timeout, max_bytes, pool_size):
+        self.timeout = (connect_timeout, read_timeout)
+        self.total_timeout = total_timeout
+        self.max_bytes = max_bytes
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.9, */*;q=0.1',
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+
+    def fetch(self, url, etag=None, modified=None):
+        """Download a feed, sending validators for a conditional GET"""
+        scheme = urlparse(url).scheme
+        if scheme not in ('http', 'https'):
+            return self._read_file(url[len('file://'):] if scheme == 'file' else url)
+
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+
+        deadline = time.monotonic() + self.total_timeout
+        with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+            response_headers = {name.lower(): value for name, value in response.headers.items()}
+            if response.status_code == 304:
+                return FetchResult(response.url, 304, response_headers, b'', 0)
+            response.raise_for_status()
+
+            aborted = threading.Event()
+            watchdog = threading.Timer(max(0, deadline - time.monotonic()), self._abort, (response, aborted))
+            watchdog.daemon = True
+            watchdog.start()
+
+            chunks = []
+            size = 0
+            try:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise ValueError(f"Feed body exceeds {self.max_bytes} bytes")
+                    chunks.append(chunk)
+            except Exception:
+                if not aborted.is_set():
+                    raise
+            finally:
+                watchdog.cancel()
+
+            # A shut-down socket may also look like a cleanly ended body
+            if aborted.is_set():
+                raise TimeoutError(f"Feed download exceeded {self.total_timeout}s")
+
+            return FetchResult(response.url, response.status_code, response_headers, b''.join(chunks), response.raw.tell())
+
+    @staticmethod
+    def _abort(response, aborted):
+        """Cut a download off at its deadline by shutting its socket down"""
+        aborted.set()
+        sock = getattr(response.raw.connection, 'sock', None)
+        if sock is None:
+            response.close()
+            return
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def _read_file(self, path):
+        if os.path.getsize(path) > self.max_bytes:
+            raise ValueError(f"Feed body exceeds {self.max_bytes} bytes")
+        with open(path, 'rb') as f:
+            body = f.read()
+        return FetchResult(path, 200, {}, body, len(body))
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,105 @@
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Metrics:
+    """Thread-safe timers and counters, exportable as JSON or Prometheus text
+
+    Series are identified by a name plus optional labels, e.g.
+    `metrics.count("feed_entries_total", 12, feed=url)`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.timers = {}
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def count(self, name, value=1, **labels):
+        """Add value to a counter"""
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """Record one timing sample"""
+        key = self._key(name, labels)
+        with self._lock:
+            timer = self.timers.setdefault(key, {'count': 0, 'total_seconds': 0.0, 'max_seconds': 0.0})
+            timer['count'] += 1
+            timer['total_seconds'] += seconds
+            timer['max_seconds'] = max(timer['max_seconds'], seconds)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        """Time the enclosed block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def as_dict(self):
+        """Machine-readable snapshot: {"counters": {name: [...]}, "timers": {name: [...]}}"""
+        with self._lock:
+            counters = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                counters.setdefault(name, []).append({'labels': dict(labels), 'value': value})
+
+            timers = {}
+            for (name, labels), timer in sorted(self.timers.items()):
+                series = {'labels': dict(labels), 'count': timer['count']}
+                series['total_seconds'] = round(timer['total_seconds'], 6)
+                series['max_seconds'] = round(timer['max_seconds'], 6)
+                timers.setdefault(name, []).append(series)
+
+        return {'counters': counters, 'timers': timers}
+
+    def to_prometheus(self, prefix='sustainnews_'):
+        """Render all series in the Prometheus text exposition format"""
+        snapshot = self.as_dict()
+        lines = []
+
+        for name, series_list in snapshot['counters'].items():
+            lines.append(f"# TYPE {prefix}{name} counter")
+            for series in series_list:
+                lines.append(f"{prefix}{name}{_format_labels(series['labels'])} {series['value']}")
+
+        for name, series_list in snapshot['timers'].items():
+            lines.append(f"# TYPE {prefix}{name} summary")
+            for series in series_list:
+                labels = _format_labels(series['labels'])
+                lines.append(f"{prefix}{name}_sum{labels} {series['total_seconds']}")
+                lines.append(f"{prefix}{name}_count{labels} {series['count']}")
+            lines.append(f"# TYPE {prefix}{name}_max gauge")
+            for series in series_list:
+                lines.append(f"{prefix}{name}_max{_format_labels(series['labels'])} {series['max_seconds']}")
+
+        return '\n'.join(lines) + '\n'
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    pairs = (f'{key}="{_escape_label(value)}"' for key, value in sorted(labels.items()))
+    return '{' + ','.join(pairs) + '}'
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def timed(name, **labels):
+    """Decorator timing a method into `self.metrics`"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.metrics.timer(name, **labels):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,32 @@
+import json
+import os
+
+
+def read_json(path, default=None):
+    """Parsed content of a JSON file, or `default` when it is missing or corrupt"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def write_atomic(path, body):
+    """Write bytes via a temporary file renamed over `path`
+
+    Readers see the old file or the new one, never a partial write.
+    Missing parent directories are created.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+
+def write_json(path, data, **options):
+    """Write data as UTF-8 JSON atomically; `options` go to json.dumps"""
+    write_atomic(path, json.dumps(data, ensure_ascii=False, **options).encode('utf-8'))
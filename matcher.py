@@ -0,0 +1,176 @@
+from collections import deque
+
+# Match modes for a phrase
+SUBSTRING = 0  # anywhere in the text, like `phrase in text`
+WORD = 1       # whole words only, tolerating a plural "s" ("war" matches "wars", not "software")
+PREFIX = 2     # must start at a word boundary, any ending ("crypto*" matches "cryptocurrency")
+
+# Shared (immutable) result for groups without any match
+NO_HITS = frozenset()
+
+
+class PhraseMatcher:
+    """Aho-Corasick automaton that finds every phrase of several groups in one pass
+
+    Phrases are matched case-insensitively, either as plain substrings (the
+    same way `phrase.lower() in text` would) or on word boundaries, but all of
+    them are found with a single walk over the text instead of one scan per
+    phrase.
+    """
+
+    def __init__(self, groups, whole_word_groups=()):
+        # groups: {label: [phrase, ...]}; a phrase may belong to several groups.
+        # Phrases in whole_word_groups only match on word boundaries
+        self.groups = {}
+        for label, phrases in groups.items():
+            mode_for = self._word_mode if label in whole_word_groups else self._substring_mode
+            self.groups[label] = {mode_for(phrase.lower()) for phrase in phrases}
+        self.keys = sorted(set().union(*self.groups.values())) if self.groups else []
+
+        # Reverse index so grouping only touches the phrases actually found
+        self._labels = {key: [] for key in self.keys}
+        for label, keys in self.groups.items():
+            for key in keys:
+                self._labels[key].append(label)
+
+        self._build()
+
+    @staticmethod
+    def _substring_mode(phrase):
+        return (phrase, SUBSTRING)
+
+    @staticmethod
+    def _word_mode(phrase):
+        # A trailing "*" marks a stem ("monogam*" matches "monogamy", "monogamous")
+        if phrase.endswith('*'):
+            return (phrase[:-1], PREFIX)
+        return (phrase, WORD)
+
+    def _build(self):
+        """Build the trie, failure links and a full transition table"""
+        goto = [{}]
+        outputs = [[]]
+
+        for key in self.keys:
+            state = 0
+            for ch in key[0]:
+                if ch not in goto[state]:
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][ch] = len(goto) - 1
+                state = goto[state][ch]
+            outputs[state].append(key)
+
+        # Breadth-first pass: resolve failure links and fold every fallback
+        # transition into the table, so matching never has to backtrack
+        fail = [0] * len(goto)
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        queue = deque(goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            delta[state] = dict(delta[fail[state]])
+            delta[state].update(goto[state])
+            outputs[state] = outputs[state] + outputs[fail[state]]
+
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0)
+                queue.append(child)
+
+        self._delta = delta
+        self._outputs = [tuple(out) for out in outputs]
+
+    def search(self, text):
+        """Return {(phrase, mode): end offset of its first match} for every match in text
+
+        The text is expected to be lowercased already.
+        """
+        found = {}
+        delta = self._delta
+        outputs = self._outputs
+        length = len(text)
+        state = 0
+
+        for end, ch in enumerate(text, 1):
+            state = delta[state].get(ch, 0)
+            if outputs[state]:
+                for key in outputs[state]:
+                    if key in found:
+                        continue
+                    phrase, mode = key
+                    if mode != SUBSTRING and not self._on_boundaries(text, length, end - len(phrase), end, mode):
+                        continue
+                    found[key] = end
+
+        return found
+
+    @staticmethod
+    def _on_boundaries(text, length, start, end, mode):
+        """Check the word boundaries around text[start:end]"""
+        if start > 0 and text[start - 1].isalnum():
+            return False
+        if mode == PREFIX or end == length or not text[end].isalnum():
+            return True
+        # Allow a simple plural: "wars", "elections"
+        return text[end] == 's' and (end + 1 == length or not text[end + 1].isalnum())
+
+    def group_hits(self, found, limit=None):
+        """Group search() results into {label: set of phrases}
+
+        With `limit`, only phrases whose first match ends at or before that
+        offset are counted (e.g. the title part of "title description").
+        """
+        hits = dict.fromkeys(self.groups, NO_HITS)
+        for key, end in found.items():
+            if limit is not None and end > limit:
+                continue
+            for label in self._labels[key]:
+                if hits[label] is NO_HITS:
+                    hits[label] = set()
+                hits[label].add(key[0])
+        return hits
+
+    def scan(self, text):
+        """Return {label: set of phrases found in text}"""
+        return self.group_hits(self.search(text))
+
+
+class RejectionRules:
+    """REJECTION_RULES compiled into one whole-word matcher
+
+    "any" rules fire when one of their keywords appears; "context" rules fire
+    when a main keyword and a forbidden keyword co-occur. Rules are checked in
+    their configured order so the first matching rule gives the reason.
+    """
+
+    def __init__(self, rules):
+        self.groups = {}
+        self.rules = []
+
+        for index, (rule_type, keywords, *extra) in enumerate(rules):
+            if rule_type == "any":
+                self.groups[(index, "any")] = keywords
+                self.rules.append((rule_type, index, f"Rejected by {keywords[0].rstrip('*')} rule"))
+            elif rule_type == "context" and extra:
+                main_words, forbidden_words = keywords, extra[0]
+                self.groups[(index, "main")] = main_words
+                self.groups[(index, "forbidden")] = forbidden_words
+                reason = f"Rejected by contextual rule: {main_words[0].rstrip('*')} + {forbidden_words[0].rstrip('*')}"
+                self.rules.append((rule_type, index, reason))
+
+        self.matcher = PhraseMatcher(self.groups, whole_word_groups=self.groups.keys())
+
+    def evaluate(self, hits):
+        """Turn {group: matched phrases} into the (bool, reason) verdict"""
+        for rule_type, index, reason in self.rules:
+            if rule_type == "any":
+                if hits[(index, "any")]:
+                    return True, reason
+            elif hits[(index, "main")] and hits[(index, "forbidden")]:
+                return True, reason
+        return False, ""
+
+    def check(self, content):
+        """Return (should_reject, reason) for lowercased content"""
+        return self.evaluate(self.matcher.scan(content))
@@ -0,0 +1,100 @@
+import hashlib
+import re
+from collections import defaultdict
+
+WORD_RE = re.compile(r'\w+')
+
+
+def shingles(text, size):
+    """Set of word n-grams of the lowercased text"""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHashLSH:
+    """MinHash signatures with LSH banding for sub-quadratic similarity search
+
+    Each document gets a signature of `num_perm` minimum hashes; the signature
+    is cut into `bands` bands and only documents sharing a whole band are
+    compared. With b bands of r rows, pairs are found with probability
+    1 - (1 - s^r)^b for Jaccard similarity s.
+    """
+
+    def __init__(self, num_perm=64, bands=16, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        # Each "permutation" XORs the 64-bit shingle hash with a fixed random
+        # mask; deterministic so signatures are stable across runs
+        self.masks = [
+            int.from_bytes(hashlib.blake2b(f"{seed}:{i}".encode(), digest_size=8).digest(), 'big')
+            for i in range(num_perm)
+        ]
+
+    def signature(self, shingle_set):
+        """MinHash signature of a set of shingles"""
+        if not shingle_set:
+            return None
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), 'big') for s in shingle_set]
+        return tuple(min(map(mask.__xor__, hashes)) for mask in self.masks)
+
+    def candidate_pairs(self, signatures):
+        """Yield index pairs that share at least one band bucket"""
+        seen = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            buckets = defaultdict(list)
+            for index, signature in enumerate(signatures):
+                if signature is not None:
+                    buckets[signature[start:start + self.rows]].append(index)
+
+            for members in buckets.values():
+                for i in range(len(members)):
+                    for j in range(i + 1, len(members)):
+                        pair = (members[i], members[j])
+                        if pair not in seen:
+                            seen.add(pair)
+                            yield pair
+
+
+def jaccard(first, second):
+    """Exact Jaccard similarity of two sets"""
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def find_clusters(texts, threshold=0.5, shingle_size=2, num_perm=64, bands=16):
+    """Group near-duplicate texts, returning lists of indexes (singletons omitted)
+
+    LSH only proposes candidate pairs; each is confirmed against the exact
+    Jaccard similarity of the shingle sets, since the MinHash estimate can
+    run high enough to merge unrelated stories.
+    """
+    lsh = MinHashLSH(num_perm=num_perm, bands=bands)
+    shingle_sets = [shingles(text, shingle_size) for text in texts]
+    signatures = [lsh.signature(shingle_set) for shingle_set in shingle_sets]
+
+    # Union-find over confirmed pairs
+    parent = list(range(len(texts)))
+
+    def root(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    for i, j in lsh.candidate_pairs(signatures):
+        if jaccard(shingle_sets[i], shingle_sets[j]) >= threshold:
+            parent[root(j)] = root(i)
+
+    clusters = defaultdict(list)
+    for index in range(len(texts)):
+        clusters[root(index)].append(index)
+
+    return [members for members in clusters.values() if len(members) > 1]
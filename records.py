@@ -0,0 +1,67 @@
+import sys
+
+
+class Article:
+    """Compact in-memory article
+
+    Uses __slots__ instead of a per-article dict, interns the few distinct
+    source/tier values shared by thousands of rows, and derives `content`
+    from the description instead of storing the text twice. The published
+    dict shape is only produced by to_dict() when saving.
+    """
+
+    __slots__ = (
+        'title', 'description', 'url', 'published_at', 'source',
+        'relevance_score', 'source_tier', 'api_source', 'near_duplicates',
+    )
+
+    def __init__(self, title, description, url, published_at, source,
+                 relevance_score, source_tier, api_source='rss', near_duplicates=None):
+        self.title = title
+        self.description = description
+        self.url = url
+        self.published_at = published_at
+        self.source = sys.intern(source)
+        self.relevance_score = relevance_score
+        self.source_tier = sys.intern(source_tier)
+        self.api_source = sys.intern(api_source)
+        self.near_duplicates = near_duplicates
+
+    @property
+    def content(self):
+        return self.description[:200]
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build an article from the saved/cached dict shape"""
+        return cls(
+            title=data['title'],
+            description=data['description'],
+            url=data['url'],
+            published_at=data['publishedAt'],
+            source=data['source'],
+            relevance_score=data['relevance_score'],
+            source_tier=data['source_tier'],
+            api_source=data.get('api_source', 'rss'),
+            near_duplicates=data.get('near_duplicates'),
+        )
+
+    def to_dict(self):
+        """Convert to the dict shape written to news_detailed.json"""
+        data = {
+            'title': self.title,
+            'description': self.description,
+            'url': self.url,
+            'publishedAt': self.published_at,
+            'source': self.source,
+            'content': self.content,
+            'relevance_score': self.relevance_score,
+            'source_tier': self.source_tier,
+            'api_source': self.api_source,
+        }
+        if self.near_duplicates:
+            data['near_duplicates'] = self.near_duplicates
+        return data
+
+    def __repr__(self):
+        return f"Article({self.title!r}, score={self.relevance_score}, tier={self.source_tier})"
@@ -0,0 +1,52 @@
+from functools import lru_cache
+from urllib.parse import urlparse
+
+
+@lru_cache(maxsize=1024)
+def get_domain(url):
+    """Host part of a URL, parsed once per distinct URL"""
+    return urlparse(url).netloc
+
+
+class FeedRegistry:
+    """O(1) lookups from feed URL to tier and from domain to display name
+
+    Built once from the feed and source-name tables. Domains are resolved by
+    walking their suffixes, so `feeds.bbci.co.uk` finds the `bbci.co.uk` entry.
+    """
+
+    def __init__(self, feeds_by_tier, source_names, default_tier):
+        self.default_tier = default_tier
+        self.tier_by_feed = {}
+        for tier, feeds in feeds_by_tier.items():
+            for feed_url in feeds:
+                self.tier_by_feed.setdefault(feed_url, tier)
+
+        self.source_names = {domain.lower(): name for domain, name in source_names.items()}
+        self._names_by_domain = {}
+
+    def tier(self, feed_url):
+        """Tier of a configured feed, or the default tier for unknown feeds"""
+        return self.tier_by_feed.get(feed_url, self.default_tier)
+
+    def source_name(self, feed_url):
+        """Display name of the publisher behind a feed URL"""
+        domain = get_domain(feed_url)
+        name = self._names_by_domain.get(domain)
+        if name is None:
+            name = self._names_by_domain[domain] = self._resolve(domain)
+        return name
+
+    def _resolve(self, domain):
+        host = domain.split(':')[0].lower()
+
+        # feeds.bbci.co.uk -> bbci.co.uk -> co.uk -> uk
+        labels = host.split('.')
+        for i in range(len(labels)):
+            name = self.source_names.get('.'.join(labels[i:]))
+            if name is not None:
+                return name
+
+        # Default: clean up domain name
+        clean_name = domain.replace('www.', '').split('.')[0]
+        return clean_name.title()
@@ -0,0 +1,146 @@
+"""Re-score an article archive with the current keyword rules, across processes
+
+Run from the repository root after changing the keyword configuration:
+
+    python rescore.py news_raw.json rescored.json [--config rules.yaml] [--workers 8]
+
+Input and output may be a JSON archive document or a .jsonl file. Articles
+the rejection rules now drop are left out; the rest keep their fields with a
+new relevance_score (rule score and tier bonus, without the fetch-time
+recency bonus).
+"""
+import argparse
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from archive import ArchiveWriter, iter_archive, iter_jsonl
+from config_loader import ConfigLoader
+from fetch_news import DEFAULT_CONFIG
+
+CHUNK_SIZE = 2000       # Articles per task; large enough to amortize the IPC round trip
+IN_FLIGHT_PER_WORKER = 2  # Chunks queued ahead per worker, bounding memory on huge archives
+
+# Set once per worker process by _init_worker
+_analyzer = None
+
+
+def _init_worker(analyzer):
+    """Receive the compiled matcher tables once, instead of with every task"""
+    global _analyzer
+    _analyzer = analyzer
+
+
+def _score_chunk(rows):
+    """Score (title, description, tier) rows, returning (rejected, reason, score) per row"""
+    results = []
+    for title, description, tier in rows:
+        analysis = _analyzer.analyze(title, description, tier)
+        results.append((analysis['rejected'], analysis['reason'], analysis['score']))
+    return results
+
+
+def iter_chunks(articles, size):
+    chunk = []
+    for article in articles:
+        chunk.append(article)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def rescore(articles, config, workers=None, chunk_size=CHUNK_SIZE):
+    """Yield (article, (rejected, reason, score)) in archive order
+
+    Chunks are scored in a process pool; only a few chunks per worker are in
+    flight at once and results are merged back in submission order.
+    """
+    def rows(chunk):
+        return [
+            (
+                article.get('title') or '',
+                article.get('description') or '',
+                article.get('source_tier') if article.get('source_tier') in config.tier_config
+                else config.registry.default_tier,
+            )
+            for article in chunk
+        ]
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(config.analyzer)
+        for chunk in iter_chunks(articles, chunk_size):
+            yield from zip(chunk, _score_chunk(rows(chunk)))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(config.analyzer,)) as executor:
+        pending = deque()
+        for chunk in iter_chunks(articles, chunk_size):
+            pending.append((chunk, executor.submit(_score_chunk, rows(chunk))))
+            if len(pending) >= workers * IN_FLIGHT_PER_WORKER:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result())
+        while pending:
+            chunk, future = pending.popleft()
+            yield from zip(chunk, future.result())
+
+
+def read_articles(path):
+    return iter_jsonl(path) if path.endswith('.jsonl') else iter_archive(path)
+
+
+def write_articles(path, articles):
+    """Write articles as a JSON archive document or JSON Lines, returning the count"""
+    if not path.endswith('.jsonl'):
+        with ArchiveWriter(path) as writer:
+            for article in articles:
+                writer.write(article)
+        return writer.count
+
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for article in articles:
+            f.write(json.dumps(article, ensure_ascii=False) + '\n')
+            written += 1
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('input', help="archive to re-score (JSON document or .jsonl)")
+    parser.add_argument('output', help="where to write the re-scored archive (JSON document or .jsonl)")
+    parser.add_argument(
+        '--config', default=os.environ.get('SUSTAIN_NEWS_CONFIG'),
+        help="JSON/YAML/TOML file overriding the built-in feeds, tiers and keyword rules",
+    )
+    parser.add_argument('--workers', type=int, help="worker processes (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    config = ConfigLoader(DEFAULT_CONFIG, args.config).get()
+    stats = {"total": 0, "rejected": 0, "changed": 0}
+
+    def kept():
+        for article, (rejected, reason, score) in rescore(read_articles(args.input), config, args.workers, args.chunk_size):
+            stats["total"] += 1
+            if rejected:
+                stats["rejected"] += 1
+                continue
+            if score != article.get('relevance_score'):
+                stats["changed"] += 1
+            yield {**article, 'relevance_score': score}
+
+    started = time.perf_counter()
+    written = write_articles(args.output, kept())
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ Re-scored {stats['total']} articles in {elapsed:.1f}s")
+    print(f"   Rejected by rules: {stats['rejected']}, score changed: {stats['changed']}, written: {written}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+import hashlib
+import re
+
+from json_store import read_json, write_json
+
+# Runs of letters and digits, single characters included ("scope 3", "vitamin d");
+# index.html tokenizes queries with the same rule
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+# Bumped whenever tokenize() changes, so stored tokens are recomputed
+TOKENIZER_VERSION = 2
+
+
+def tokenize(text):
+    """Distinct lowercase word tokens of a text"""
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+class SearchIndex:
+    """Inverted index (token -> article ids) for client-side search, updated incrementally
+
+    The tokens of every indexed article are kept next to the postings, so a
+    run only tokenizes articles that are new or whose text changed, and only
+    touches the postings of those and of articles that went away.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.docs = {}       # article id -> {'sig': text hash, 'tokens': [...]}
+        self.postings = {}   # token -> set of article ids
+        self.load()
+
+    def load(self):
+        """Load the index state; a missing, corrupt or differently tokenized file starts empty"""
+        data = read_json(self.path) or {}
+        if data.get('tokenizer') != TOKENIZER_VERSION:
+            return
+        self.docs = data.get('docs', {})
+        for doc_id, doc in self.docs.items():
+            for token in doc['tokens']:
+                self.postings.setdefault(token, set()).add(doc_id)
+
+    def save(self):
+        """Write the index state back to disk"""
+        write_json(self.path, {'tokenizer': TOKENIZER_VERSION, 'docs': self.docs}, separators=(',', ':'))
+
+    def _remove(self, doc_id):
+        for token in self.docs.pop(doc_id)['tokens']:
+            ids = self.postings[token]
+            ids.discard(doc_id)
+            if not ids:
+                del self.postings[token]
+
+    def update(self, texts):
+        """Make the index cover exactly {article id: text}, returning (added, removed, reused)"""
+        removed = [doc_id for doc_id in self.docs if doc_id not in texts]
+        for doc_id in removed:
+            self._remove(doc_id)
+
+        added = reused = 0
+        for doc_id, text in texts.items():
+            sig = hashlib.md5(text.encode('utf-8')).hexdigest()
+            doc = self.docs.get(doc_id)
+            if doc is not None and doc['sig'] == sig:
+                reused += 1
+                continue
+            if doc is not None:
+                self._remove(doc_id)
+
+            tokens = sorted(tokenize(text))
+            self.docs[doc_id] = {'sig': sig, 'tokens': tokens}
+            for token in tokens:
+                self.postings.setdefault(token, set()).add(doc_id)
+            added += 1
+
+        return added, len(removed), reused
+
+    def export(self, doc_ids):
+        """Compact client form: sorted tokens, each with the positions of its articles in doc_ids
+
+        Sorted tokens let the client find every token with a given prefix by
+        binary search.
+        """
+        position = {doc_id: number for number, doc_id in enumerate(doc_ids)}
+        tokens = sorted(self.postings)
+        return {
+            'docs': list(doc_ids),
+            'tokens': tokens,
+            'postings': [sorted(position[doc_id] for doc_id in self.postings[token]) for token in tokens],
+        }
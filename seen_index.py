@@ -0,0 +1,70 @@
+import json
+import os
+import sqlite3
+import time
+
+
+class SeenIndex:
+    """Persistent SQLite index of feed entries already cleaned and scored
+
+    Each entry key maps to the candidate it produced (article plus score
+    before the recency bonus), or to nothing when the rejection rules
+    dropped it. Later runs reuse these results instead of reprocessing.
+    A candidate is scored for its feed's tier, so it is only reused for
+    that tier; rule rejections do not depend on the tier.
+    """
+
+    def __init__(self, path, rules_version, retention_days=14):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.retention_days = retention_days
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " key TEXT PRIMARY KEY,"
+            " feed_url TEXT,"
+            " candidate TEXT,"      # JSON candidate, NULL when rejected by rules
+            " first_seen REAL)"
+        )
+
+        # Results computed with other rules are worthless; start over
+        row = self.connection.execute("SELECT value FROM meta WHERE name = 'rules_version'").fetchone()
+        if row is None or row[0] != rules_version:
+            self.connection.execute("DELETE FROM seen")
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (name, value) VALUES ('rules_version', ?)", (rules_version,)
+            )
+        self.connection.commit()
+
+    def lookup(self, key, tier):
+        """Return (seen, candidate); candidate is None for rule-rejected entries"""
+        row = self.connection.execute("SELECT candidate FROM seen WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False, None
+        if row[0] is None:
+            return True, None
+        candidate = json.loads(row[0])
+        if candidate['article']['source_tier'] != tier:
+            return False, None
+        return True, candidate
+
+    def record(self, key, feed_url, candidate):
+        """Remember the outcome of processing an entry"""
+        self.connection.execute(
+            "INSERT OR REPLACE INTO seen (key, feed_url, candidate, first_seen) VALUES (?, ?, ?, ?)",
+            (key, feed_url, json.dumps(candidate, ensure_ascii=False) if candidate is not None else None, time.time()),
+        )
+
+    def save(self):
+        """Drop entries past the retention window and commit"""
+        cutoff = time.time() - self.retention_days * 86400
+        self.connection.execute("DELETE FROM seen WHERE first_seen < ?", (cutoff,))
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
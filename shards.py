@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from compression import base_name
+from json_store import read_json, write_atomic
+
+# Shard orders: name -> sort key over the already relevance-sorted article list
+ORDERS = {
+    'relevance': None,
+    'date': lambda article: article.published_at,
+}
+
+def article_id(article):
+    """Short id that stays the same for an article across runs"""
+    return hashlib.md5(article.url.encode('utf-8')).hexdigest()[:12]
+
+
+def frontend_article(article):
+    """The article shape the web frontend reads (also used by news.json)"""
+    return {
+        'id': article_id(article),
+        'source': {'name': article.source},
+        'author': article.source,
+        'title': article.title,
+        'description': article.description,
+        'url': article.url,
+        'publishedAt': article.published_at,
+        'content': article.content,
+        'score': article.relevance_score,
+    }
+
+
+def serialize(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def content_hash(data):
+    """Canonical hash of JSON-serializable data, independent of dict key order"""
+    return hashlib.sha256(json.dumps(data, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def write_addressed(directory, stem, data):
+    """Write data under a name derived from its content, returning the file name
+
+    A content-addressed file never changes once written, so clients can cache
+    it indefinitely, and rewriting identical content is skipped.
+    """
+    body = serialize(data).encode('utf-8')
+    name = f"{stem}.{hashlib.sha256(body).hexdigest()[:12]}.json"
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        write_atomic(path, body)
+    return name
+
+
+def read_manifest(directory):
+    """The published manifest (the pointer to the current files), or None"""
+    return read_json(os.path.join(directory, 'manifest.json'))
+
+
+def manifest_files(manifest):
+    """Names of the files in the output directory a manifest points at"""
+    if not manifest:
+        return set()
+    files = {name for order in manifest.get('orders', {}).values() for name in order.get('files', [])}
+    if manifest.get('search_index'):
+        files.add(manifest['search_index'])
+    return files
+
+
+def write_shards(articles, directory, page_size, extra=None):
+    """Write the articles as fixed-size page shards per order, returning their manifest
+
+    The manifest is small and lists every shard, so a client renders its
+    first page from the manifest and one shard and fetches the rest later.
+    Shards are content-addressed; the manifest is not written here, see
+    publish_manifest. `extra` is merged into the manifest.
+    """
+    os.makedirs(directory, exist_ok=True)
+    rows = [frontend_article(article) for article in articles]
+    pages = max(1, -(-len(rows) // page_size))
+
+    manifest = {
+        'generated_at': datetime.now().isoformat(),
+        'total': len(rows),
+        'page_size': page_size,
+        'orders': {},
+        'sources': sorted({article.source for article in articles}),
+        **(extra or {}),
+    }
+
+    for order, key in ORDERS.items():
+        ordered = rows if key is None else [
+            row for _, row in sorted(zip(articles, rows), key=lambda pair: key(pair[0]), reverse=True)
+        ]
+        files = [
+            write_addressed(directory, f"{order}-{page + 1}", {
+                'order': order,
+                'page': page + 1,
+                'articles': ordered[page * page_size:(page + 1) * page_size],
+            })
+            for page in range(pages)
+        ]
+        manifest['orders'][order] = {'pages': pages, 'files': files}
+    return manifest
+
+
+def publish_manifest(directory, manifest, previous=None):
+    """Write the manifest, the one file that changes in place, then clean up
+
+    Call it after every file of the publish is written: the manifest is the
+    pointer clients and the next run go by. Files referenced by neither the
+    new manifest nor the `previous` one are removed.
+    """
+    write_atomic(os.path.join(directory, 'manifest.json'), serialize(manifest).encode('utf-8'))
+
+    # The previous generation stays one more run for clients still holding the old manifest
+    keep = manifest_files(manifest) | manifest_files(previous) | {'manifest.json'}
+    for name in os.listdir(directory):
+        if base_name(name).endswith('.json') and base_name(name) not in keep and os.path.isfile(os.path.join(directory, name)):
+            os.remove(os.path.join(directory, name))
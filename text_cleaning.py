@@ -0,0 +1,60 @@
+import html
+import re
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # lxml is optional; the regex path covers every feed
+    lxml = None
+
+# Compiled once instead of on every entry
+TAG_RE = re.compile(r'<[^<]+?>')
+TRUNCATION_RE = re.compile(r'\[\s*…\s*\]|\[\s*\.\.\.\s*\]')
+
+MAX_LENGTH = 200          # Descriptions longer than this get shortened
+SENTENCE_WINDOW = 150     # Keep only the first sentence if it ends within this window
+
+
+def strip_tags(markup):
+    """Decode HTML entities and remove tags with the compiled regex"""
+    return TAG_RE.sub('', html.unescape(markup))
+
+
+def html_to_text(markup):
+    """Convert markup to text with lxml, dropping scripts and styles"""
+    try:
+        document = lxml.html.fromstring(markup)
+    except (etree.ParserError, ValueError):
+        return strip_tags(markup)
+    etree.strip_elements(document, 'script', 'style', with_tail=False)
+    # Block elements leave newlines and indentation behind; collapse them
+    return ' '.join(document.text_content().split())
+
+
+def shorten(text):
+    """Cut long text at its first sentence, or hard-truncate it"""
+    if len(text) <= MAX_LENGTH:
+        return text
+
+    # Only look for the terminator inside the window instead of splitting the whole text
+    end = text.find('.', 0, SENTENCE_WINDOW)
+    if end != -1:
+        return text[:end] + '.'
+    return text[:MAX_LENGTH - 3] + '...'
+
+
+def clean_description(description, lxml_min_tags=None):
+    """Turn a raw feed description into a short plain-text summary
+
+    Markup with at least `lxml_min_tags` tags goes through lxml when it is
+    installed; everything else uses the regex stripper.
+    """
+    if lxml is not None and lxml_min_tags is not None and description.count('<') >= lxml_min_tags:
+        text = html_to_text(description)
+    else:
+        text = strip_tags(description)
+
+    # Remove publisher-added truncation markers
+    text = TRUNCATION_RE.sub('', text).strip()
+
+    return shorten(text).strip()